@@ -10,19 +10,207 @@
 # License: the Apache License Version 2.0                                     #
 ###############################################################################
 
+import asyncio
 import os
 import pathlib
+import stat
 import subprocess
+import tempfile
 import logging
-from typing import Tuple
+import datetime
+import functools
+import ipaddress
+from typing import List, Optional, Tuple
+
+# Optional: with `cryptography` installed, keys and certificates are produced
+# in-process instead of forking openssl for every genpkey/req/x509 step.
+try:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, rsa
+    from cryptography.x509.oid import NameOID
+    HAVE_CRYPTOGRAPHY = True
+except ImportError:
+    HAVE_CRYPTOGRAPHY = False
+
+# Key algorithm for the CA and service keys: "ec:P-256" (default, fast keygen),
+# "ec:P-384" or "rsa:<bits>" such as "rsa:4096". Override with EPA_CERT_ALG or --key-alg.
+KEY_ALG = os.environ.get("EPA_CERT_ALG", "ec:P-256")
+
+# Curves accepted in KEY_ALG, by NIST name
+EC_CURVES = ("P-256", "P-384")
+
+MASTER_DIR = pathlib.Path("./certs/_master")
+CA_KEY = MASTER_DIR / "ca.key"
+CA_CRT = MASTER_DIR / "ca.crt"
+
+# CA material read once per run and shared by every service
+_CA_CRT_BYTES: Optional[bytes] = None
+_CA_PARSED = None
+
+# Serializes CA signing: concurrent `openssl x509 -CAcreateserial` runs share ca.srl
+_SIGN_LOCK: Optional[asyncio.Lock] = None
+
+
+async def run_openssl(cmd: List[str], input: Optional[bytes] = None) -> bytes:
+    """Run an openssl command without blocking the event loop.
+
+    Mirrors subprocess.run(..., check=True): raises CalledProcessError on a non-zero exit.
+    `input` is fed to the process on stdin (e.g. for `-config /dev/stdin`).
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate(input)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=stdout, stderr=stderr)
+    return stdout
+
+
+async def sign_with_ca(cmd: List[str], input: Optional[bytes] = None) -> bytes:
+    """Run an `openssl x509 -CA ...` signing command, one at a time."""
+    global _SIGN_LOCK
+    if _SIGN_LOCK is None:
+        _SIGN_LOCK = asyncio.Lock()
+    async with _SIGN_LOCK:
+        return await run_openssl(cmd, input)
+
+
+def _load_ca_bytes() -> bytes:
+    """Return the CA certificate bytes, reading ca.crt only once."""
+    global _CA_CRT_BYTES
+    if _CA_CRT_BYTES is None:
+        _CA_CRT_BYTES = CA_CRT.read_bytes()
+    return _CA_CRT_BYTES
+
+
+def _load_ca_parsed():
+    """Return the parsed (CA key, CA certificate) pair, loading it only once."""
+    global _CA_PARSED
+    if _CA_PARSED is None:
+        _CA_PARSED = (
+            serialization.load_pem_private_key(CA_KEY.read_bytes(), password=None),
+            x509.load_pem_x509_certificate(_load_ca_bytes()),
+        )
+    return _CA_PARSED
+
+
+def _reset_ca_cache():
+    """Forget cached CA material after the CA pair is (re)generated."""
+    global _CA_CRT_BYTES, _CA_PARSED
+    _CA_CRT_BYTES = _CA_PARSED = None
+
+
+def parse_key_alg(alg: str) -> Tuple[str, str]:
+    """Split a KEY_ALG value into (kind, parameter), e.g. ("ec", "P-256") or ("rsa", "4096")."""
+    kind, _, param = alg.partition(":")
+    kind = kind.strip().lower()
+    param = param.strip()
+    if kind == "ec" and param.upper() in EC_CURVES:
+        return ("ec", param.upper())
+    if kind == "rsa" and param.isdigit() and int(param) >= 2048:
+        return ("rsa", param)
+    raise ValueError(f"Unsupported key algorithm {alg!r}; use ec:P-256, ec:P-384 or rsa:<bits>=2048+")
+
+
+def generate_private_key():
+    """Generate a private key for KEY_ALG with `cryptography`."""
+    kind, param = parse_key_alg(KEY_ALG)
+    if kind == "ec":
+        return ec.generate_private_key(ec.SECP256R1() if param == "P-256" else ec.SECP384R1())
+    return rsa.generate_private_key(public_exponent=65537, key_size=int(param))
+
+
+def openssl_genpkey_args() -> List[str]:
+    """`openssl genpkey` arguments producing a KEY_ALG key."""
+    kind, param = parse_key_alg(KEY_ALG)
+    if kind == "ec":
+        return ["-algorithm", "EC", "-pkeyopt", f"ec_paramgen_curve:{param}"]
+    return ["-algorithm", "RSA", "-pkeyopt", f"rsa_keygen_bits:{param}"]
+
+
+def openssl_newkey_args() -> List[str]:
+    """`openssl req` arguments generating a new KEY_ALG key alongside the CSR."""
+    kind, param = parse_key_alg(KEY_ALG)
+    if kind == "ec":
+        return ["-newkey", "ec", "-pkeyopt", f"ec_paramgen_curve:{param}"]
+    return ["-newkey", f"rsa:{param}"]
+
+
+def write_private_key(key, key_path: pathlib.Path):
+    """Write an unencrypted PEM private key readable only by the owner."""
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    fd = os.open(str(key_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(pem)
+
+
+def issue_ca_inprocess(key_path: pathlib.Path, crt_path: pathlib.Path, days: int):
+    """Generate the CA key and self-signed certificate with `cryptography`."""
+    key = generate_private_key()
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "SFC-CA")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=days))
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .add_extension(x509.SubjectKeyIdentifier.from_public_key(key.public_key()), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+    write_private_key(key, key_path)
+    crt_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+
+
+def issue_service_cert_inprocess(key_path: pathlib.Path, cert_path: pathlib.Path, base_name: str, days: int):
+    """Generate a service key and a CA-signed certificate with `cryptography`."""
+    ca_key, ca_cert = _load_ca_parsed()
+
+    key = generate_private_key()
+    now = datetime.datetime.now(datetime.timezone.utc)
+    builder = (
+        x509.CertificateBuilder()
+        .subject_name(x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, base_name)]))
+        .issuer_name(ca_cert.subject)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=days))
+        .add_extension(x509.AuthorityKeyIdentifier.from_issuer_public_key(ca_key.public_key()), critical=False)
+    )
+    spec = SERVICE_SPEC.get(base_name, {})
+    san = [x509.DNSName(name) for name in spec.get("san_dns", [])]
+    san += [x509.IPAddress(ipaddress.ip_address(ip)) for ip in spec.get("san_ip", [])]
+    if san:
+        builder = builder.add_extension(x509.SubjectAlternativeName(san), critical=False)
+    cert = builder.sign(ca_key, hashes.SHA256())
+
+    write_private_key(key, key_path)
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+
+
+def is_directory(path) -> bool:
+    """Return True if path exists as a directory, using a single stat() call."""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
 
 def check_docker_volume_conflicts(file_paths):
     """Check if any of the target file paths exist as directories (Docker volume mount issue)."""
-    conflicts = []
-    for path in file_paths:
-        path_obj = pathlib.Path(path)
-        if path_obj.exists() and path_obj.is_dir():
-            conflicts.append(path_obj)
+    conflicts = [pathlib.Path(path) for path in file_paths if is_directory(path)]
     
     if conflicts:
         print("ERROR: The following certificate files exist as directories!")
@@ -38,24 +226,31 @@ def check_docker_volume_conflicts(file_paths):
 
 def create_certificates():
     # Create CA certificates under ./certs/_master/
-    dest = pathlib.Path("./certs/_master")
-    dest.mkdir(parents=True, exist_ok=True)
-
-    key_path = dest / "ca.key"
-    crt_path = dest / "ca.crt"
+    dest = MASTER_DIR
+    key_path = CA_KEY
+    crt_path = CA_CRT
 
     # If they already exist, leave them alone
     if key_path.exists() and crt_path.exists():
         logging.info("CA key and certificate already exist at %s. Skipping generation.", dest)
         return (key_path, crt_path)
 
+    dest.mkdir(parents=True, exist_ok=True)
+
     subj = "/CN=SFC-CA"
     days = "3650"
 
+    if HAVE_CRYPTOGRAPHY:
+        logging.info("Generating CA private key and self-signed certificate: %s, %s", key_path, crt_path)
+        issue_ca_inprocess(key_path, crt_path, int(days))
+        _reset_ca_cache()
+        logging.info("Created CA key and certificate at %s", dest)
+        return (key_path, crt_path)
+
     try:
         # Generate private key
         logging.info("Generating CA private key: %s", key_path)
-        subprocess.run(["openssl", "genrsa", "-out", str(key_path), "4096"], check=True)
+        subprocess.run(["openssl", "genpkey"] + openssl_genpkey_args() + ["-out", str(key_path)], check=True)
 
         # Generate self-signed cert
         logging.info("Generating self-signed CA certificate: %s", crt_path)
@@ -83,172 +278,192 @@ def create_certificates():
             logging.debug("Failed to chmod private key; continuing.")
 
         logging.info("Created CA key and certificate at %s", dest)
+        _reset_ca_cache()
         return (key_path, crt_path)
     except subprocess.CalledProcessError as e:
         logging.error("OpenSSL command failed: %s", e)
         raise
 
 
-def gen_sign_csr(dest: pathlib.Path, base_name: str, subj: str, days: str = "3650") -> Tuple[pathlib.Path, pathlib.Path]:
-    """Generate a private key, CSR and sign it with the master CA.
-
-    Returns (key_path, cert_path).
-    If both key and cert already exist, the function will skip generation and return them.
-    """
-    master = pathlib.Path("./certs/_master")
-    ca_key = master / "ca.key"
-    ca_crt = master / "ca.crt"
-
-    # Ensure CA exists
-    if not (ca_key.exists() and ca_crt.exists()):
-        create_certificates()
-
-    dest.mkdir(parents=True, exist_ok=True)
-
-    key_path = dest / f"{base_name}.key"
-    csr_path = dest / f"{base_name}.csr"
-    cert_path = dest / f"{base_name}.crt"
-
-    # Check for Docker volume mount conflicts
-    if not check_docker_volume_conflicts([key_path, cert_path]):
-        return (None, None)
+@functools.lru_cache(maxsize=1)
+def ensure_ca() -> Tuple[pathlib.Path, pathlib.Path]:
+    """Make sure the CA pair exists; the check runs once per process."""
+    return create_certificates()
+
+
+# Per-service TLS material. Services listed with SAN entries get a
+# subjectAltName extension; the rest are signed with a plain CN subject.
+SERVICE_SPEC = {
+    "proxy": {
+        "dest": "./certs/proxy",
+        "label": "TLS Proxy",
+        "san_dns": ["proxy", "localhost"],
+        "san_ip": ["127.0.0.1"],
+        "conf_name": "proxy_tls.conf",
+        "conf_tmpl": (
+            "# Minimal HTTPS Proxy TLS configuration (example)\n"
+            "tls_cert = {cert}\n"
+            "tls_key = {key}\n"
+            "tls_ca = {ca}\n"
+        ),
+    },
+    "s3": {
+        "dest": "./certs/s3",
+        "label": "S3",
+        "san_dns": ["s3"],
+        "conf_name": "s3_tls.conf",
+        "conf_tmpl": (
+            "# Minimal S3 TLS configuration (example)\n"
+            "tls_cert = {cert}\n"
+            "tls_key = {key}\n"
+            "tls_ca = {ca}\n"
+        ),
+    },
+    "influxdb": {
+        "dest": "./certs/influxdb",
+        "label": "InfluxDB",
+        "san_dns": ["influxdb"],
+        "conf_name": "influxdb_tls.conf",
+        "conf_tmpl": (
+            "# Minimal InfluxDB TLS configuration (example)\n"
+            "tls_enabled = true\n"
+            "tls_cert_file = {cert}\n"
+            "tls_key_file = {key}\n"
+            "tls_ca_file = {ca}\n"
+        ),
+    },
+    "grafana": {
+        "dest": "./certs/grafana",
+        "label": "Grafana",
+        "conf_name": "grafana_tls.conf",
+        "conf_tmpl": (
+            "# Minimal Grafana TLS configuration (example)\n"
+            "cert_file = {cert}\n"
+            "cert_key = {key}\n"
+            "ca_file = {ca}\n"
+        ),
+    },
+    # NOTE: InfluxDB3 Explorer expects cert.pem and key.pem hardcoded names
+    "explorer": {
+        "dest": "./certs/explorer",
+        "label": "InfluxDB Explorer",
+        "key_name": "key.pem",
+        "cert_name": "cert.pem",
+        "conf_name": "explorer_tls.conf",
+        "conf_tmpl": (
+            "# Minimal InfluxDB Explorer TLS configuration (example)\n"
+            "cert_file = {cert}\n"
+            "cert_key = {key}\n"
+            "fullchain_file = {fullchain}\n"
+            "ca_file = {ca}\n"
+        ),
+    },
+    "influx-mcp": {
+        "dest": "./certs/influx-mcp",
+        "label": "Influx MCP",
+        "conf_name": "influx_mcp_tls.conf",
+        "conf_tmpl": (
+            "# Minimal Influx MCP TLS configuration (example)\n"
+            "cert_file = {cert}\n"
+            "cert_key = {key}\n"
+            "ca_file = {ca}\n"
+        ),
+    },
+}
+
+
+def _service_paths(service: str) -> Tuple[pathlib.Path, pathlib.Path, pathlib.Path]:
+    """Return (dest, key_path, cert_path) for a service in SERVICE_SPEC."""
+    spec = SERVICE_SPEC[service]
+    dest = pathlib.Path(spec["dest"])
+    return (dest, dest / spec.get("key_name", f"{service}.key"), dest / spec.get("cert_name", f"{service}.crt"))
+
+
+def _render_tls_conf(service: str) -> str:
+    dest, key_path, cert_path = _service_paths(service)
+    return SERVICE_SPEC[service]["conf_tmpl"].format(
+        cert=str(cert_path), key=str(key_path), ca=str(dest / "ca.crt"), fullchain=str(dest / "fullchain.pem")
+    )
 
-    # If already present, skip
-    if key_path.exists() and cert_path.exists():
-        logging.info("%s TLS key and certificate already exist. Skipping generation.", base_name)
-        return (key_path, cert_path)
 
-    # Generate key and CSR, then sign with CA    
-    logging.info("Generating %s private key...", base_name)
-    subprocess.run(["openssl", "genrsa", "-out", str(key_path), "4096"], check=True)
+# Output paths are fixed per service, so example TLS config files are rendered once at import
+_TLS_CONF_TEXT = {service: _render_tls_conf(service) for service in SERVICE_SPEC}
 
-    if base_name == "s3":
-        # Write SAN config for S3
-        san_config = dest / "s3_san.cnf"
-        san_config.write_text(f"""
+SAN_CONFIG_TEMPLATE = """
 [req]
 distinguished_name = req_distinguished_name
 x509_extensions = v3_req
 prompt = no
 
 [req_distinguished_name]
-CN = s3
+CN = {cn}
 
 [v3_req]
 subjectAltName = @alt_names
 
 [alt_names]
-DNS.1 = s3
-""")
-        logging.info("Generating %s CSR with SAN...", base_name)
-        subprocess.run([
-            "openssl", "req", "-new", "-key", str(key_path), "-out", str(csr_path), "-config", str(san_config)
-        ], check=True)
-        logging.info("Signing %s certificate with CA and SAN...", base_name)
-        subprocess.run([
-            "openssl", "x509", "-req", "-in", str(csr_path), "-CA", str(ca_crt), "-CAkey", str(ca_key), "-CAcreateserial",
-            "-out", str(cert_path), "-days", days, "-sha256", "-extensions", "v3_req", "-extfile", str(san_config)
-        ], check=True)
-        try:
-            san_config.unlink()
-        except Exception:
-            pass
-    elif base_name == "proxy":
-        # Write SAN config for inbound proxy
-        san_config = dest / "proxy.cnf"
-        san_config.write_text(f"""
-[req]
-distinguished_name = req_distinguished_name
-x509_extensions = v3_req
-prompt = no
+{alt_names}
+"""
 
-[req_distinguished_name]
-CN = proxy
 
-[v3_req]
-subjectAltName = @alt_names
+def san_config_text(base_name: str) -> str:
+    """Render the openssl SAN config for a service from SERVICE_SPEC."""
+    spec = SERVICE_SPEC[base_name]
+    alt_names = [f"DNS.{i} = {name}" for i, name in enumerate(spec.get("san_dns", []), 1)]
+    alt_names += [f"IP.{i} = {ip}" for i, ip in enumerate(spec.get("san_ip", []), 1)]
+    return SAN_CONFIG_TEMPLATE.format(cn=base_name, alt_names="\n".join(alt_names))
 
-[alt_names]
-DNS.1 = proxy
-DNS.2 = localhost
-IP.1 = 127.0.0.1
-""")
-        logging.info("Generating %s CSR with SAN...", base_name)
-        subprocess.run([
-            "openssl", "req", "-new", "-key", str(key_path), "-out", str(csr_path), "-config", str(san_config)
-        ], check=True)
-        logging.info("Signing %s certificate with CA and SAN...", base_name)
-        subprocess.run([
-            "openssl", "x509", "-req", "-in", str(csr_path), "-CA", str(ca_crt), "-CAkey", str(ca_key), "-CAcreateserial",
-            "-out", str(cert_path), "-days", days, "-sha256", "-extensions", "v3_req", "-extfile", str(san_config)
-        ], check=True)
-        try:
-            san_config.unlink()
-        except Exception:
-            pass
 
-    elif base_name == "influxdb":
-        # Write SAN config for InfluxDB
-        san_config = dest / "influxdb_san.cnf"
-        san_config.write_text(f"""
-[req]
-distinguished_name = req_distinguished_name
-x509_extensions = v3_req
-prompt = no
+async def gen_sign_csr_async(dest: pathlib.Path, base_name: str, subj: str, days: str = "3650") -> Tuple[pathlib.Path, pathlib.Path]:
+    """Generate a private key, CSR and sign it with the master CA.
 
-[req_distinguished_name]
-CN = influxdb
+    Returns (key_path, cert_path).
+    If both key and cert already exist, the function will skip generation and return them.
+    """
+    key_path = dest / f"{base_name}.key"
+    csr_path = dest / f"{base_name}.csr"
+    cert_path = dest / f"{base_name}.crt"
 
-[v3_req]
-subjectAltName = @alt_names
+    # Check for Docker volume mount conflicts
+    if not check_docker_volume_conflicts([key_path, cert_path]):
+        return (None, None)
 
-[alt_names]
-DNS.1 = influxdb
-""")
-        logging.info("Generating %s CSR with SAN...", base_name)
-        subprocess.run([
-            "openssl", "req", "-new", "-key", str(key_path), "-out", str(csr_path), "-config", str(san_config)
-        ], check=True)
+    # If already present, skip before touching the CA or spawning anything
+    if key_path.exists() and cert_path.exists():
+        logging.info("%s TLS key and certificate already exist. Skipping generation.", base_name)
+        return (key_path, cert_path)
+
+    ensure_ca()
+
+    dest.mkdir(parents=True, exist_ok=True)
+
+    if HAVE_CRYPTOGRAPHY:
+        logging.info("Generating %s private key and CA-signed certificate...", base_name)
+        await asyncio.to_thread(issue_service_cert_inprocess, key_path, cert_path, base_name, int(days))
+        link_ca(dest / "ca.crt")
+        return (key_path, cert_path)
+
+    # Generate key and CSR in one openssl call, then sign with CA
+    new_key_csr_cmd = [
+        "openssl", "req", "-new", *openssl_newkey_args(), "-nodes", "-keyout", str(key_path), "-out", str(csr_path),
+    ]
+    sign_cmd = [
+        "openssl", "x509", "-req", "-in", str(csr_path), "-CA", str(CA_CRT), "-CAkey", str(CA_KEY), "-CAcreateserial",
+        "-out", str(cert_path), "-days", days, "-sha256",
+    ]
+    spec = SERVICE_SPEC.get(base_name, {})
+    if spec.get("san_dns") or spec.get("san_ip"):
+        # SAN config is fed on stdin rather than through a temporary .cnf file
+        san_config = san_config_text(base_name).encode()
+        logging.info("Generating %s private key and CSR with SAN...", base_name)
+        await run_openssl(new_key_csr_cmd + ["-config", "/dev/stdin"], input=san_config)
         logging.info("Signing %s certificate with CA and SAN...", base_name)
-        subprocess.run([
-            "openssl", "x509", "-req", "-in", str(csr_path), "-CA", str(ca_crt), "-CAkey", str(ca_key), "-CAcreateserial",
-            "-out", str(cert_path), "-days", days, "-sha256", "-extensions", "v3_req", "-extfile", str(san_config)
-        ], check=True)
-        try:
-            san_config.unlink()
-        except Exception:
-            pass
+        await sign_with_ca(sign_cmd + ["-extensions", "v3_req", "-extfile", "/dev/stdin"], input=san_config)
     else:
-        logging.info("Generating %s CSR...", base_name)
-        subprocess.run([
-            "openssl",
-            "req",
-            "-new",
-            "-key",
-            str(key_path),
-            "-out",
-            str(csr_path),
-            "-subj",
-            subj,
-        ], check=True)
+        logging.info("Generating %s private key and CSR...", base_name)
+        await run_openssl(new_key_csr_cmd + ["-subj", subj])
         logging.info("Signing %s certificate with CA...", base_name)
-        subprocess.run([
-            "openssl",
-            "x509",
-            "-req",
-            "-in",
-            str(csr_path),
-            "-CA",
-            str(ca_crt),
-            "-CAkey",
-            str(ca_key),
-            "-CAcreateserial",
-            "-out",
-            str(cert_path),
-            "-days",
-            days,
-            "-sha256",
-        ], check=True)    
+        await sign_with_ca(sign_cmd)
 
     # Restrict permissions on private key
     try:
@@ -256,8 +471,8 @@ DNS.1 = influxdb
     except OSError:
         logging.debug("Failed to chmod %s private key; continuing.", base_name)
 
-    # Copy CA public cert (binary-safe)
-    (dest / "ca.crt").write_bytes(ca_crt.read_bytes())
+    # Link (or copy) CA public cert
+    link_ca(dest / "ca.crt")
 
     # Clean up CSR
     try:
@@ -267,208 +482,98 @@ DNS.1 = influxdb
 
     return (key_path, cert_path)
 
-def create_influxdb_config():
-    # Create InfluxDB 3 CSR, sign it with CA key, copy to ./certs/influxdb
-    master = pathlib.Path("./certs/_master")
-    ca_key = master / "ca.key"
-    ca_crt = master / "ca.crt"
-
-    # Ensure CA exists
-    if not (ca_key.exists() and ca_crt.exists()):
-        create_certificates()
-
-    dest = pathlib.Path("./certs/influxdb")
-    key_path, cert_path = gen_sign_csr(dest, "influxdb", "/CN=influxdb")
-
-    # Write a tiny example TLS config file for convenience
-    conf_path = dest / "influxdb_tls.conf"
-    conf_text = (
-        "# Minimal InfluxDB TLS configuration (example)\n"
-        "tls_enabled = true\n"
-        f"tls_cert_file = {str(cert_path)}\n"
-        f"tls_key_file = {str(key_path)}\n"
-        f"tls_ca_file = {str(dest / 'ca.crt')}\n"
-    )
-    with open(str(conf_path), "w", encoding="utf-8") as fh:
-        fh.write(conf_text)
-
-    logging.info("InfluxDB TLS material created at %s", str(dest))
-    return (key_path, cert_path)
-
-def create_s3_config():
-    # Create S3 Gateway CSR, sign it with CA key, copy to ./certs/s3
-    master = pathlib.Path("./certs/_master")
-    ca_key = master / "ca.key"
-    ca_crt = master / "ca.crt"
-
-    if not (ca_key.exists() and ca_crt.exists()):
-        create_certificates()
-
-    dest = pathlib.Path("./certs/s3")
-    key_path, cert_path = gen_sign_csr(dest, "s3", "/CN=s3")
-
-    conf_path = dest / "s3_tls.conf"
-    conf_text = (
-        "# Minimal S3 TLS configuration (example)\n"
-        f"tls_cert = {str(cert_path)}\n"
-        f"tls_key = {str(key_path)}\n"
-        f"tls_ca = {str(dest / 'ca.crt')}\n"
-    )
-    with open(str(conf_path), "w", encoding="utf-8") as fh:
-        fh.write(conf_text)
-
-    logging.info("S3 TLS material created at %s", str(dest))
-    return (key_path, cert_path)
-
-def create_proxy_config():
-    # Create Reverse Proxy CSR, sign it with CA key, copy to ./certs/proxy
-    master = pathlib.Path("./certs/_master")
-    ca_key = master / "ca.key"
-    ca_crt = master / "ca.crt"
 
-    if not (ca_key.exists() and ca_crt.exists()):
-        create_certificates()
-
-    dest = pathlib.Path("./certs/proxy")
-    key_path, cert_path = gen_sign_csr(dest, "proxy", "/CN=proxy")
-
-    conf_path = dest / "proxy_tls.conf"
-    conf_text = (
-        "# Minimal HTTPS Proxy TLS configuration (example)\n"
-        f"tls_cert = {str(cert_path)}\n"
-        f"tls_key = {str(key_path)}\n"
-        f"tls_ca = {str(dest / 'ca.crt')}\n"
-    )
-    with open(str(conf_path), "w", encoding="utf-8") as fh:
-        fh.write(conf_text)
-
-    logging.info("TLS Proxy material created at %s", str(dest))
-    return (key_path, cert_path)
-
-def create_grafana_config():
-    # Create Grafana CSR, sign it with CA key, copy to ./certs/grafana
-    master = pathlib.Path("./certs/_master")
-    ca_key = master / "ca.key"
-    ca_crt = master / "ca.crt"
+def gen_sign_csr(dest: pathlib.Path, base_name: str, subj: str, days: str = "3650") -> Tuple[pathlib.Path, pathlib.Path]:
+    """Synchronous wrapper around gen_sign_csr_async for one-off use."""
+    return asyncio.run(gen_sign_csr_async(dest, base_name, subj, days))
 
-    if not (ca_key.exists() and ca_crt.exists()):
-        create_certificates()
 
-    dest = pathlib.Path("./certs/grafana")
-    key_path, cert_path = gen_sign_csr(dest, "grafana", "/CN=grafana")
+def atomic_write_bytes(path: pathlib.Path, data: bytes):
+    """Write data to path via a temporary file and os.replace, so readers never see a partial file."""
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, str(path))
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
-    conf_path = dest / "grafana_tls.conf"
-    conf_text = (
-        "# Minimal Grafana TLS configuration (example)\n"
-        f"cert_file = {str(cert_path)}\n"
-        f"cert_key = {str(key_path)}\n"
-        f"ca_file = {str(dest / 'ca.crt')}\n"
-    )
-    with open(str(conf_path), "w", encoding="utf-8") as fh:
-        fh.write(conf_text)
 
-    logging.info("Grafana TLS material created at %s", str(dest))
-    return (key_path, cert_path)
+def write_explorer_fullchain(cert_path: pathlib.Path, fullchain_path: pathlib.Path):
+    # Create fullchain.pem (cert + CA chain) for Explorer compatibility
+    if not CA_CRT.exists():
+        return
+    fullchain_content = cert_path.read_bytes() + b"\n" + _load_ca_bytes()
 
+    # Skip the rewrite when the existing fullchain already has exactly this content
+    if fullchain_path.exists() and fullchain_path.read_bytes() == fullchain_content:
+        logging.info("fullchain.pem for Explorer is up to date")
+        return
 
-def create_explorer_config():
-    # Create InfluxDB Explorer CSR, sign it with CA key, copy to ./certs/explorer
-    # NOTE: InfluxDB3 Explorer expects cert.pem and key.pem hardcoded names
-    master = pathlib.Path("./certs/_master")
-    ca_key = master / "ca.key"
-    ca_crt = master / "ca.crt"
+    atomic_write_bytes(fullchain_path, fullchain_content)
+    logging.info("Created fullchain.pem for Explorer")
 
-    if not (ca_key.exists() and ca_crt.exists()):
-        create_certificates()
 
-    dest = pathlib.Path("./certs/explorer")
-    dest.mkdir(parents=True, exist_ok=True)
+async def create_service_config_async(service: str):
+    """Create a service key/certificate signed by the CA plus an example TLS config file."""
+    spec = SERVICE_SPEC[service]
+    dest, key_path, cert_path = _service_paths(service)
+    fullchain_path = dest / "fullchain.pem"
 
-    # Generate with expected InfluxDB3 Explorer names
-    key_path = dest / "key.pem"
-    cert_path = dest / "cert.pem"
-    fullchain_path = dest / "fullchain.pem"  # Alternative format for Explorer
-    
-    # If already present, skip
-    if key_path.exists() and cert_path.exists():
+    if service == "explorer" and key_path.exists() and cert_path.exists():
         logging.info("Explorer TLS key and certificate already exist. Skipping generation.")
-        # Still create fullchain.pem if it doesn't exist
-        if not fullchain_path.exists():
-            if ca_crt.exists():
-                # Create fullchain.pem = cert + CA
-                fullchain_content = cert_path.read_text() + "\n" + ca_crt.read_text()
-                fullchain_path.write_text(fullchain_content)
-                logging.info("Created fullchain.pem for Explorer")
+        # Still create (or refresh) fullchain.pem if it is missing or stale
+        write_explorer_fullchain(cert_path, fullchain_path)
         return (key_path, cert_path)
 
-    # Generate temporary files with standard naming, then rename
-    temp_key, temp_cert = gen_sign_csr(dest, "explorer", "/CN=explorer")
-    
-    # Rename to InfluxDB3 Explorer expected names
-    temp_key.rename(key_path)
-    temp_cert.rename(cert_path)
-    
-    # Create fullchain.pem (cert + CA chain) for Explorer compatibility
-    if ca_crt.exists():
-        fullchain_content = cert_path.read_text() + "\n" + ca_crt.read_text()
-        fullchain_path.write_text(fullchain_content)
-        logging.info("Created fullchain.pem for Explorer")
-
-    conf_path = dest / "explorer_tls.conf"
-    conf_text = (
-        "# Minimal InfluxDB Explorer TLS configuration (example)\n"
-        f"cert_file = {str(cert_path)}\n"
-        f"cert_key = {str(key_path)}\n"
-        f"fullchain_file = {str(fullchain_path)}\n"
-        f"ca_file = {str(dest / 'ca.crt')}\n"
-    )
-    with open(str(conf_path), "w", encoding="utf-8") as fh:
-        fh.write(conf_text)
-
-    logging.info("InfluxDB Explorer TLS material created at %s", str(dest))
-    return (key_path, cert_path)
+    temp_key, temp_cert = await gen_sign_csr_async(dest, service, f"/CN={service}")
 
-def create_influx_mcp_config():
-    # Create InfluxDB MCP server CSR, sign it with CA key, copy to ./certs/influx-mcp
-    master = pathlib.Path("./certs/_master")
-    ca_key = master / "ca.key"
-    ca_crt = master / "ca.crt"
+    if service == "explorer":
+        # Rename to InfluxDB3 Explorer expected names
+        temp_key.rename(key_path)
+        temp_cert.rename(cert_path)
+        write_explorer_fullchain(cert_path, fullchain_path)
+    else:
+        key_path, cert_path = temp_key, temp_cert
 
-    if not (ca_key.exists() and ca_crt.exists()):
-        create_certificates()
+    # Write a tiny example TLS config file for convenience
+    (dest / spec["conf_name"]).write_text(_TLS_CONF_TEXT[service], encoding="utf-8")
 
-    dest = pathlib.Path("./certs/influx-mcp")
-    key_path, cert_path = gen_sign_csr(dest, "influx-mcp", "/CN=influx-mcp")
+    logging.info("%s TLS material created at %s", spec["label"], str(dest))
+    return (key_path, cert_path)
 
-    conf_path = dest / "influx_mcp_tls.conf"
-    conf_text = (
-        "# Minimal Influx MCP TLS configuration (example)\n"
-        f"cert_file = {str(cert_path)}\n"
-        f"cert_key = {str(key_path)}\n"
-        f"ca_file = {str(dest / 'ca.crt')}\n"
-    )
-    with open(str(conf_path), "w", encoding="utf-8") as fh:
-        fh.write(conf_text)
+def link_ca(dst: pathlib.Path):
+    """Hardlink the master CA certificate to dst, copying it if linking is not possible."""
+    try:
+        if dst.exists() and os.path.samefile(CA_CRT, dst):
+            return
+        dst.unlink(missing_ok=True)
+        os.link(CA_CRT, dst)
+    except OSError:
+        # Different filesystem or no hardlink support: fall back to a plain copy
+        dst.write_bytes(_load_ca_bytes())
 
-    logging.info("Influx MCP TLS material created at %s", str(dest))
-    return (key_path, cert_path)
 
 def copy_ca_to_all():
-    # Copies CA public key to all locations
+    # Links (or copies) CA public key to all locations
     for service in ALL_CONTAINERS:
-        src = pathlib.Path("./certs/_master/ca.crt")
         dst = pathlib.Path(f"./certs/{service}/ca.crt")
         dst.parent.mkdir(parents=True, exist_ok=True)
         
         # Check if destination exists as a directory (Docker volume mount issue)
-        if dst.exists() and dst.is_dir():
+        if is_directory(dst):
             print(f"ERROR: {dst} exists as a directory!")
             print("This usually happens when Docker Compose creates volume mount points before certificates exist.")
             print(f"Please remove the directory: rm -rf {dst}")
             print("Then run this script again.")
             return False
             
-        dst.write_bytes(src.read_bytes())
+        link_ca(dst)
     return True
 
 
@@ -477,45 +582,41 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate CA and per-service TLS certificates.")
     # EPA Collector and Utils don't provide user-facing services and "CA" is just for generating the CA
     parser.add_argument("--service", nargs='+', choices=["all", "proxy", "s3", "influxdb", "grafana", "explorer", "influx-mcp", "utils", "ca"], default=["all"], help="Which certs to generate")
+    parser.add_argument("--key-alg", default=KEY_ALG, help="Key algorithm for new keys: ec:P-256 (default), ec:P-384 or rsa:<bits> (e.g. rsa:4096). Also settable via EPA_CERT_ALG")
     args = parser.parse_args()
+
+    try:
+        parse_key_alg(args.key_alg)
+    except ValueError as e:
+        parser.error(str(e))
+    KEY_ALG = args.key_alg
     
     selected_services = set(args.service)
     ALL_CONTAINERS = ["proxy", "s3", "influxdb", "grafana", "explorer", "collector", "influx-mcp", "utils"]
     
-    # helper for invoking all
-    def run_all():
-        create_certificates()
-        create_proxy_config()
-        create_s3_config()
-        create_influxdb_config()        
-        create_grafana_config()
-        create_explorer_config()
-        create_influx_mcp_config()
-        if not copy_ca_to_all():
-            exit(1)
+    async def generate_services(services):
+        # Run key generation for all selected services concurrently
+        results = await asyncio.gather(*(create_service_config_async(name) for name in services), return_exceptions=True)
+        ok = True
+        for name, result in zip(services, results):
+            if isinstance(result, BaseException):
+                logging.error("Failed to create %s TLS material: %s", name, result)
+                ok = False
+        return ok
 
     if "all" in selected_services:
-        run_all()
+        services = list(SERVICE_SPEC)
     else:
-        # Always ensure CA exists first if we are doing anything
-        create_certificates()
-        
-        if "proxy" in selected_services:
-            create_proxy_config()
-        if "s3" in selected_services:
-            create_s3_config()
-        if "influxdb" in selected_services:
-            create_influxdb_config()
-        if "grafana" in selected_services:
-            create_grafana_config()
-        if "explorer" in selected_services:
-            create_explorer_config()
-        if "influx-mcp" in selected_services:
-            create_influx_mcp_config()
-            
-        # Copy CA to all containers regardless of selection to be safe, 
-        # or we could try to be smart. The original script copied to ALL at the end of 'else'.
-        # Since users might simply want to update one cert but ensure CA is everywhere...
-        # Also handles 'utils' / 'collector' cases which just need CA.
-        copy_ca_to_all()
+        services = [name for name in SERVICE_SPEC if name in selected_services]
+
+    # Always ensure CA exists first if we are doing anything
+    ensure_ca()
+
+    if not asyncio.run(generate_services(services)):
+        exit(1)
 
+    # Link CA to all containers regardless of selection to be safe.
+    # Users might simply want to update one cert but ensure CA is everywhere;
+    # this also handles 'utils' / 'collector' cases which just need CA.
+    if not copy_ca_to_all():
+        exit(1)
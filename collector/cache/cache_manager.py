@@ -1,17 +1,49 @@
+import os
+import sys
 import time
 import logging
-from typing import Dict, Generic, Optional, TypeVar, Any
+from typing import Dict, Generic, Hashable, Mapping, Optional, Tuple, TypeVar, Any, Union
 
 # Type variable for our cache generic
 T = TypeVar('T')
 
+# Cache types are plain names ('systems') or tuples partitioning a category ('drives', system_id)
+CacheType = Hashable
+
+# Collection-tracking keys are plain names ('drives') or (category, system_id) tuples
+CollectionKey = Union[str, Tuple[str, str]]
+
+# Cache types whose set operations are tracked for system_id debugging
+_SYSTEM_TYPES = frozenset({'system_info', 'systems', 'system:config'})
+
+
+def _caller_chain(depth: int = 3) -> str:
+    """Describe the callers of CacheManager.set as 'file:function:line' entries."""
+    chain = []
+    frame = sys._getframe(2)  # skip this helper and CacheManager.set
+    while frame is not None and len(chain) < depth:
+        code = frame.f_code
+        chain.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+        frame = frame.f_back
+    return ' -> '.join(chain)
+
+
+class _Entry:
+    """A cached value and the time it was stored."""
+    __slots__ = ('value', 'ts')
+
+    def __init__(self, value: Any, ts: float):
+        self.value = value
+        self.ts = ts
+
+
 class CacheManager(Generic[T]):
     """
     Generic cache manager for API response objects
 
     Provides:
     - Time-based expiration
-    - Collection frequency control
+    - Collection frequency control, with explicit invalidation
     - Access to cached objects by ID and type
     """
 
@@ -22,72 +54,71 @@ class CacheManager(Generic[T]):
         Args:
             ttl_seconds: Default time-to-live in seconds
         """
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._timestamps: Dict[str, float] = {}
+        self._cache: Dict[CacheType, Dict[str, _Entry]] = {}
         self._ttl_seconds = ttl_seconds
-        self._last_collection: Dict[str, float] = {}
+        self._last_collection: Dict[CollectionKey, float] = {}
+        # Per collection type: current version (bumped by invalidate) and version last collected
+        self._versions: Dict[CollectionKey, int] = {}
+        self._collected_versions: Dict[CollectionKey, int] = {}
         self.logger = logging.getLogger(__name__)
 
         # Debug counters for system_id tracking
         self._system_set_counters: Dict[str, int] = {}
 
-    def set(self, cache_type: str, key: str, value: T) -> None:
+    def set(self, cache_type: CacheType, key: str, value: T) -> None:
         """
         Store an object in the cache
 
         Args:
-            cache_type: Type of cached object (e.g., 'drives', 'volumes')
+            cache_type: Type of cached object (e.g., 'systems', or ('drives', system_id))
             key: Unique identifier for the object
             value: Object to cache
         """
-        # Debug logging for system identification cache operations
-        if cache_type in ['system_info', 'systems', 'system:config'] or 'system' in cache_type.lower():
-            import inspect
-            frame = inspect.currentframe()
-            caller_info = []
-            try:
-                # Get caller stack to identify who is setting system info
-                current_frame = frame
-                for _ in range(1, 4):  # Check up to 3 levels up the call stack
-                    if current_frame is None:
-                        break
-                    caller_frame = current_frame.f_back
-                    if caller_frame is None:
-                        break
-                    caller_info.append({
-                        'function': caller_frame.f_code.co_name,
-                        'file': caller_frame.f_code.co_filename.split('/')[-1],
-                        'line': caller_frame.f_lineno
-                    })
-                    current_frame = caller_frame
-            except Exception:
-                caller_info = [{'function': 'unknown', 'file': 'unknown', 'line': 0}]
-
-            # Check if this is a duplicate set operation for the same key
-            is_update = (cache_type in self._cache and key in self._cache[cache_type])
-            existing_value = self._cache[cache_type][key] if is_update else None
-
+        # Debug logging for system identification cache operations.
+        # Nothing below can be emitted when WARNING is disabled, so skip the bookkeeping too.
+        if cache_type in _SYSTEM_TYPES and self.logger.isEnabledFor(logging.WARNING):
             # Track frequency of system_id sets per key
             counter_key = f"{cache_type}:{key}"
-            self._system_set_counters[counter_key] = self._system_set_counters.get(counter_key, 0) + 1
-            set_count = self._system_set_counters[counter_key]
+            set_count = self._system_set_counters.get(counter_key, 0) + 1
+            self._system_set_counters[counter_key] = set_count
 
-            # Log with warning if we're setting the same key multiple times (potential overwrite)
+            # Log with warning if we're setting the same key multiple times (potential overwrite).
+            # Caller frames are only walked when the record will actually be emitted.
             if set_count > 1:
-                self.logger.warning(f"CACHE_SET #{set_count}: {cache_type}[{key}] = {value} "
-                                  f"(OVERWRITING existing: {existing_value}) "
-                                  f"called by: {' -> '.join([f"{c['file']}:{c['function']}:{c['line']}" for c in caller_info])}")
-            else:
-                self.logger.debug(f"CACHE_SET #{set_count}: {cache_type}[{key}] = {value} "
-                                f"called by: {' -> '.join([f"{c['file']}:{c['function']}:{c['line']}" for c in caller_info])}")
+                existing = self._cache.get(cache_type, {}).get(key)
+                existing_value = existing.value if existing is not None else None
+                self.logger.warning("CACHE_SET #%d: %s[%s] = %s (OVERWRITING existing: %s) called by: %s",
+                                    set_count, cache_type, key, value, existing_value, _caller_chain())
+            elif self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("CACHE_SET #%d: %s[%s] = %s called by: %s",
+                                  set_count, cache_type, key, value, _caller_chain())
 
         if cache_type not in self._cache:
             self._cache[cache_type] = {}
 
-        self._cache[cache_type][key] = value
-        self._timestamps[f"{cache_type}:{key}"] = time.time()
+        self._cache[cache_type][key] = _Entry(value, time.time())
+
+    def bulk_set(self, cache_type: CacheType, mapping: Mapping[str, T]) -> None:
+        """
+        Store many objects of one type in the cache with a single timestamp
 
-    def get(self, cache_type: str, key: str) -> Optional[T]:
+        Args:
+            cache_type: Type of cached objects (e.g., ('drives', system_id))
+            mapping: Unique identifier -> object to cache
+        """
+        if cache_type in _SYSTEM_TYPES:
+            # Keep the per-key set tracking for system identification types
+            for key, value in mapping.items():
+                self.set(cache_type, key, value)
+            return
+
+        now = time.time()
+        type_cache = self._cache.get(cache_type)
+        if type_cache is None:
+            type_cache = self._cache[cache_type] = {}
+        type_cache.update({key: _Entry(value, now) for key, value in mapping.items()})
+
+    def get(self, cache_type: CacheType, key: str) -> Optional[T]:
         """
         Retrieve an object from the cache
 
@@ -98,21 +129,22 @@ class CacheManager(Generic[T]):
         Returns:
             The cached object or None if not found or expired
         """
-        if cache_type not in self._cache or key not in self._cache[cache_type]:
+        type_cache = self._cache.get(cache_type)
+        if type_cache is None:
+            return None
+        entry = type_cache.get(key)
+        if entry is None:
             return None
 
         # Check expiration
-        timestamp_key = f"{cache_type}:{key}"
-        if timestamp_key in self._timestamps:
-            if time.time() - self._timestamps[timestamp_key] > self._ttl_seconds:
-                # Expired
-                del self._cache[cache_type][key]
-                del self._timestamps[timestamp_key]
-                return None
+        if time.time() - entry.ts > self._ttl_seconds:
+            # Expired
+            del type_cache[key]
+            return None
 
-        return self._cache[cache_type][key]
+        return entry.value
 
-    def get_all(self, cache_type: str) -> Dict[str, T]:
+    def get_all(self, cache_type: CacheType) -> Dict[str, T]:
         """
         Get all non-expired objects of a specific type
 
@@ -122,34 +154,29 @@ class CacheManager(Generic[T]):
         Returns:
             Dictionary of objects by key
         """
-        if cache_type not in self._cache:
+        type_cache = self._cache.get(cache_type)
+        if not type_cache:
             return {}
 
-        # Filter out expired items
+        # Filter out and drop expired items in a single pass
+        now = time.time()
+        ttl = self._ttl_seconds
         result = {}
-        expired_keys = []
-
-        for key, value in self._cache[cache_type].items():
-            timestamp_key = f"{cache_type}:{key}"
-            if timestamp_key in self._timestamps:
-                if time.time() - self._timestamps[timestamp_key] > self._ttl_seconds:
-                    expired_keys.append(key)
-                else:
-                    result[key] = value
 
-        # Clean up expired items
-        for key in expired_keys:
-            del self._cache[cache_type][key]
-            del self._timestamps[f"{cache_type}:{key}"]
+        for key, entry in list(type_cache.items()):
+            if now - entry.ts > ttl:
+                del type_cache[key]
+            else:
+                result[key] = entry.value
 
         return result
 
-    def should_collect(self, collection_type: str, interval_seconds: int) -> bool:
+    def should_collect(self, collection_type: CollectionKey, interval_seconds: int) -> bool:
         """
-        Determine if data collection should happen based on interval
+        Determine if data collection should happen based on interval or invalidation
 
         Args:
-            collection_type: Type of collection (e.g., 'drives', 'volumes')
+            collection_type: Type of collection (e.g., 'drives', or ('drives', system_id))
             interval_seconds: Minimum interval between collections
 
         Returns:
@@ -157,13 +184,16 @@ class CacheManager(Generic[T]):
         """
         current_time = time.time()
         last_time = self._last_collection.get(collection_type, 0)
+        version = self._versions.get(collection_type, 0)
 
-        if current_time - last_time >= interval_seconds:
+        if (current_time - last_time >= interval_seconds
+                or version != self._collected_versions.get(collection_type, 0)):
             self._last_collection[collection_type] = current_time
+            self._collected_versions[collection_type] = version
             return True
         return False
 
-    def mark_collected(self, collection_type: str) -> None:
+    def mark_collected(self, collection_type: CollectionKey) -> None:
         """
         Mark a collection type as collected now
 
@@ -171,8 +201,20 @@ class CacheManager(Generic[T]):
             collection_type: Type of collection to mark
         """
         self._last_collection[collection_type] = time.time()
+        self._collected_versions[collection_type] = self._versions.get(collection_type, 0)
 
-    def clear(self, cache_type: Optional[str] = None) -> None:
+    def invalidate(self, *collection_types: CollectionKey) -> None:
+        """
+        Invalidate collection types so the next should_collect() returns True
+
+        Args:
+            collection_types: Types of collection whose data is known to be stale
+        """
+        versions = self._versions
+        for collection_type in collection_types:
+            versions[collection_type] = versions.get(collection_type, 0) + 1
+
+    def clear(self, cache_type: Optional[CacheType] = None) -> None:
         """
         Clear cache entries
 
@@ -180,17 +222,10 @@ class CacheManager(Generic[T]):
             cache_type: Type to clear or None for all
         """
         if cache_type is None:
-            self._cache = {}
-            # Only clear timestamps that belong to cache entries
-            self._timestamps = {k: v for k, v in self._timestamps.items() if k.split(":")[0] not in self._cache}
-        elif cache_type in self._cache:
+            self._cache.clear()
+        else:
             # Remove all entries of this type
-            keys = list(self._cache[cache_type].keys())
-            for key in keys:
-                timestamp_key = f"{cache_type}:{key}"
-                if timestamp_key in self._timestamps:
-                    del self._timestamps[timestamp_key]
-            del self._cache[cache_type]
+            self._cache.pop(cache_type, None)
 
     def reset_system_set_counters(self) -> None:
         """Reset the system_id set operation counters for new iteration."""
@@ -201,10 +236,12 @@ class CacheManager(Generic[T]):
         """Report summary of system_id set operations for this iteration."""
         if self._system_set_counters:
             self.logger.info("CACHE_SUMMARY: System set operations this iteration:")
-            for key, count in self._system_set_counters.items():
+            for key, count in sorted(self._system_set_counters.items()):
                 cache_type, cache_key = key.split(':', 1)
-                current_value = self.get(cache_type, cache_key)
+                # Summary only: read the stored value directly, without a TTL check
+                entry = self._cache.get(cache_type, {}).get(cache_key)
+                current_value = entry.value if entry is not None else None
                 status = "MULTIPLE_SETS" if count > 1 else "SINGLE_SET"
-                self.logger.info(f"  {key}: {count} sets ({status}) - final value: {current_value}")
+                self.logger.info("  %s: %d sets (%s) - final value: %s", key, count, status, current_value)
         else:
             self.logger.debug("CACHE_SUMMARY: No system set operations recorded this iteration")
@@ -1,8 +1,8 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 import logging
 
 from .cache_manager import CacheManager
-from ..config.collection_schedules import ScheduleFrequency, FREQUENCY_MULTIPLIERS
+from ..config.collection_schedules import ScheduleFrequency, FREQUENCY_MULTIPLIERS, MAX_FREQUENCY_MULTIPLIER
 from ..schema.models import (
     DriveConfig,
     VolumeConfig,
@@ -11,6 +11,26 @@ from ..schema.models import (
     # Import other models as needed
 )
 
+# Schedule multipliers used for the per-category collection intervals, bound once at import
+_MULT_HIGH = FREQUENCY_MULTIPLIERS[ScheduleFrequency.HIGH_FREQUENCY]
+_MULT_MED = FREQUENCY_MULTIPLIERS[ScheduleFrequency.MEDIUM_FREQUENCY]
+_MULT_LOW = FREQUENCY_MULTIPLIERS[ScheduleFrequency.LOW_FREQUENCY]
+
+def calculate_cache_ttl(base_interval: int) -> int:
+    """
+    Calculate appropriate cache TTL based on collection schedules
+
+    Args:
+        base_interval: Base collection interval in seconds
+
+    Returns:
+        Cache TTL in seconds (longest collection interval + 25% buffer)
+    """
+    # Longest collection interval plus a 25% buffer so the cache doesn't expire before collection
+    # (intervals are non-negative, so >> 2 is the same as // 4)
+    return (base_interval * MAX_FREQUENCY_MULTIPLIER * 5) >> 2
+
+
 class ConfigCache:
     """
     Cache for configuration objects
@@ -22,27 +42,18 @@ class ConfigCache:
 
     Cache TTL is automatically calculated to be longer than the longest collection
     interval to prevent cache misses when collection scheduler attempts to collect.
+    A changed system configuration also invalidates that system's pools and volumes,
+    so they are recollected without waiting for their interval.
+
+    Per-system objects (drives, volumes, pools) are stored under a
+    (category, system_id) cache type, so per-system retrieval only touches that
+    system's entries.
     """
 
     @staticmethod
     def calculate_cache_ttl(base_interval: int) -> int:
-        """
-        Calculate appropriate cache TTL based on collection schedules
-
-        Args:
-            base_interval: Base collection interval in seconds
-
-        Returns:
-            Cache TTL in seconds (longest collection interval + 25% buffer)
-        """
-        # Find the longest collection interval from ScheduleFrequency
-        max_multiplier = max(FREQUENCY_MULTIPLIERS.values())
-        longest_interval = base_interval * max_multiplier
-
-        # Add 25% buffer to ensure cache doesn't expire before collection
-        cache_ttl = int(longest_interval * 1.25)
-
-        return cache_ttl
+        """Calculate appropriate cache TTL based on collection schedules (see module function)"""
+        return calculate_cache_ttl(base_interval)
 
     def __init__(self, base_interval: int = 60, ttl_seconds: Optional[int] = None):
         """
@@ -55,87 +66,111 @@ class ConfigCache:
         self.base_interval = base_interval
 
         # Calculate collection intervals based on ScheduleFrequency mappings
-        self.drive_config_interval = base_interval * FREQUENCY_MULTIPLIERS[ScheduleFrequency.LOW_FREQUENCY]
-        self.volume_config_interval = base_interval * FREQUENCY_MULTIPLIERS[ScheduleFrequency.HIGH_FREQUENCY]
-        self.system_config_interval = base_interval * FREQUENCY_MULTIPLIERS[ScheduleFrequency.LOW_FREQUENCY]
-        self.pool_config_interval = base_interval * FREQUENCY_MULTIPLIERS[ScheduleFrequency.MEDIUM_FREQUENCY]
+        self.drive_config_interval = base_interval * _MULT_LOW
+        self.volume_config_interval = base_interval * _MULT_HIGH
+        self.system_config_interval = base_interval * _MULT_LOW
+        self.pool_config_interval = base_interval * _MULT_MED
 
         # Calculate cache TTL automatically if not provided
         if ttl_seconds is None:
-            ttl_seconds = self.calculate_cache_ttl(base_interval)
+            ttl_seconds = calculate_cache_ttl(base_interval)
 
         self._cache = CacheManager(ttl_seconds=ttl_seconds)
         self.logger = logging.getLogger(__name__)
 
-        self.logger.debug(f"ConfigCache initialized with base_interval={base_interval}s, ttl={ttl_seconds}s")
-        self.logger.debug(f"Collection intervals: drives={self.drive_config_interval}s, "
-                         f"volumes={self.volume_config_interval}s, "
-                         f"systems={self.system_config_interval}s, "
-                         f"pools={self.pool_config_interval}s")
+        # Secondary index per system: pool_id -> volume IDs (a dict, kept in store order),
+        # and each volume's current pool
+        self._pool_to_volumes: Dict[str, Dict[str, Dict[str, None]]] = {}
+        self._volume_pool: Dict[str, Dict[str, str]] = {}
+
+        self.logger.debug("ConfigCache initialized with base_interval=%ds, ttl=%ds", base_interval, ttl_seconds)
+        self.logger.debug("Collection intervals: drives=%ds, volumes=%ds, systems=%ds, pools=%ds",
+                          self.drive_config_interval, self.volume_config_interval,
+                          self.system_config_interval, self.pool_config_interval)
 
     # Drive methods
     def store_drive(self, system_id: str, drive: DriveConfig) -> None:
         """Store a drive configuration"""
-        key = f"{system_id}:{drive.id}"
-        self._cache.set('drives', key, drive)
+        self._cache.set(('drives', system_id), drive.id, drive)
+
+    def store_drives_bulk(self, system_id: str, drives: Iterable[DriveConfig]) -> None:
+        """Store many drive configurations for a system in one cache update"""
+        self._cache.bulk_set(('drives', system_id), {drive.id: drive for drive in drives})
 
     def get_drive(self, system_id: str, drive_id: str) -> Optional[DriveConfig]:
         """Get a drive configuration by ID"""
-        return self._cache.get('drives', f"{system_id}:{drive_id}")
+        return self._cache.get(('drives', system_id), drive_id)
 
     def get_all_drives(self, system_id: str) -> Dict[str, DriveConfig]:
         """Get all drives for a system"""
-        all_drives = self._cache.get_all('drives')
-        # Filter to only this system's drives
-        return {k.split(':')[1]: v for k, v in all_drives.items()
-                if k.startswith(f"{system_id}:")}
+        return self._cache.get_all(('drives', system_id))
 
     def should_collect_drives(self, system_id: str) -> bool:
         """Check if drive configuration should be collected"""
-        return self._cache.should_collect(f"drives:{system_id}", self.drive_config_interval)
+        return self._cache.should_collect(('drives', system_id), self.drive_config_interval)
 
     # Volume methods
     def store_volume(self, system_id: str, volume: VolumeConfig) -> None:
         """Store a volume configuration"""
-        key = f"{system_id}:{volume.id}"
-        self._cache.set('volumes', key, volume)
+        self._cache.set(('volumes', system_id), volume.id, volume)
+
+        # Keep the pool index current, moving the volume if its pool changed
+        pool_ref = volume.get_raw('volumeGroupRef')
+        pools = self._pool_to_volumes.setdefault(system_id, {})
+        volume_pool = self._volume_pool.setdefault(system_id, {})
+        previous = volume_pool.get(volume.id, pool_ref)
+        if previous != pool_ref:
+            self._drop_from_pool(pools, previous, volume.id)
+        volume_pool[volume.id] = pool_ref
+        pools.setdefault(pool_ref, {})[volume.id] = None
+
+    @staticmethod
+    def _drop_from_pool(pools: Dict[str, Dict[str, None]], pool_id: str, volume_id: str) -> None:
+        """Remove a volume from one pool's index entry, dropping the entry once empty"""
+        members = pools.get(pool_id)
+        if members is not None:
+            members.pop(volume_id, None)
+            if not members:
+                del pools[pool_id]
 
     def get_volume(self, system_id: str, volume_id: str) -> Optional[VolumeConfig]:
         """Get a volume configuration by ID"""
-        return self._cache.get('volumes', f"{system_id}:{volume_id}")
+        return self._cache.get(('volumes', system_id), volume_id)
 
     def get_all_volumes(self, system_id: str) -> Dict[str, VolumeConfig]:
         """Get all volumes for a system"""
-        all_volumes = self._cache.get_all('volumes')
-        # Filter to only this system's volumes
-        return {k.split(':')[1]: v for k, v in all_volumes.items()
-                if k.startswith(f"{system_id}:")}
+        return self._cache.get_all(('volumes', system_id))
 
     def should_collect_volumes(self, system_id: str) -> bool:
         """Check if volume configuration should be collected"""
-        return self._cache.should_collect(f"volumes:{system_id}", self.volume_config_interval)
+        return self._cache.should_collect(('volumes', system_id), self.volume_config_interval)
 
     # Storage Pool methods
     def store_storage_pool(self, system_id: str, pool: StoragePoolConfig) -> None:
         """Store a storage pool configuration"""
-        key = f"{system_id}:{pool.id}"
-        self._cache.set('pools', key, pool)
+        self._cache.set(('pools', system_id), pool.id, pool)
 
     def get_storage_pool(self, system_id: str, pool_id: str) -> Optional[StoragePoolConfig]:
         """Get a storage pool configuration by ID"""
-        return self._cache.get('pools', f"{system_id}:{pool_id}")
+        return self._cache.get(('pools', system_id), pool_id)
 
     def should_collect_pools(self, system_id: str) -> bool:
         """Check if pool configuration should be collected"""
-        return self._cache.should_collect(f"pools:{system_id}", self.pool_config_interval)
+        return self._cache.should_collect(('pools', system_id), self.pool_config_interval)
 
     # System methods
     def store_system(self, system: SystemConfig) -> None:
         """Store system configuration"""
         if system.wwn:
+            previous = self._cache.get('systems', system.wwn)
             self._cache.set('systems', system.wwn, system)
+            if previous is not None and previous != system:
+                self._cache.invalidate(('pools', system.wwn), ('volumes', system.wwn))
+                # Volumes are re-indexed as they are recollected
+                self._pool_to_volumes.pop(system.wwn, None)
+                self._volume_pool.pop(system.wwn, None)
         else:
-            self.logger.warning(f"SystemConfig has no WWN, cannot cache: {system}")
+            self.logger.warning("SystemConfig has no WWN, cannot cache: %s", system)
 
     def get_system(self, system_id: str) -> Optional[SystemConfig]:
         """Get system configuration"""
@@ -143,14 +178,56 @@ class ConfigCache:
 
     def should_collect_system(self, system_id: str) -> bool:
         """Check if system configuration should be collected"""
-        return self._cache.should_collect(f"system:{system_id}", self.system_config_interval)
+        return self._cache.should_collect(('system', system_id), self.system_config_interval)
+
+    # Collection planning
+    def _plan_system(self, system_id: str) -> Set[str]:
+        """Evaluate every should_collect_* predicate for one system"""
+        planned = set()
+        if self.should_collect_system(system_id):
+            planned.add('system')
+        if self.should_collect_drives(system_id):
+            planned.add('drives')
+        if self.should_collect_volumes(system_id):
+            planned.add('volumes')
+        if self.should_collect_pools(system_id):
+            planned.add('pools')
+        return planned
+
+    def plan_collections(self, system_ids: Iterable[str]) -> Dict[str, Set[str]]:
+        """
+        Decide which configuration categories to collect for each system
+
+        Like the individual should_collect_* calls, planning marks the returned
+        categories as collected.
+
+        Args:
+            system_ids: Storage system IDs to plan for
+
+        Returns:
+            Mapping of system_id to the set of categories ('system', 'drives',
+            'volumes', 'pools') due for collection
+        """
+        return {system_id: self._plan_system(system_id) for system_id in dict.fromkeys(system_ids)}
 
     # Helper methods to find relationships between objects
     def get_volumes_for_pool(self, system_id: str, pool_id: str) -> List[VolumeConfig]:
-        """Get all volumes that belong to a storage pool"""
-        volumes = self.get_all_volumes(system_id)
-        return [v for v in volumes.values()
-                if v.get_raw('volumeGroupRef') == pool_id]
+        """Get all volumes that belong to a storage pool, in the order they were stored"""
+        pools = self._pool_to_volumes.get(system_id, {})
+        volumes = []
+        expired = []
+        for volume_id in pools.get(pool_id, ()):
+            volume = self.get_volume(system_id, volume_id)
+            if volume is None:
+                expired.append(volume_id)
+            else:
+                volumes.append(volume)
+
+        # Expired volumes are dropped from the index; they are re-added if stored again
+        for volume_id in expired:
+            self._drop_from_pool(pools, pool_id, volume_id)
+            self._volume_pool.get(system_id, {}).pop(volume_id, None)
+        return volumes
 
     def get_drives_for_pool(self, system_id: str, pool_id: str) -> List[DriveConfig]:
         """Get all drives that belong to a storage pool"""
@@ -3,8 +3,6 @@ Configuration management for E-Series Performance Analyzer.
 """
 
 import os
-import yaml
-import json
 from typing import List, Optional, Dict, Any
 import logging
 
@@ -14,6 +12,23 @@ LOG = logging.getLogger(__name__)
 # Default InfluxDB write precision
 INFLUXDB_WRITE_PRECISION = "s"
 
+
+# Parsers are imported on first use: env-only deployments never load a config file
+def _load_yaml(f) -> Any:
+    """Parse YAML, preferring the libyaml-backed loader when PyYAML was built with it"""
+    import yaml
+    return yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+def _load_json(text: str) -> Any:
+    """Parse JSON with orjson when installed, otherwise the standard library parser"""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads(text)
+    return orjson.loads(text)
+
 class Settings:
     """
     Configuration settings for the E-Series Performance Analyzer.
@@ -48,16 +63,17 @@ class Settings:
         """Load settings from a YAML or JSON file."""
         try:
             if not os.path.exists(config_file):
-                LOG.warning(f"Config file not found: {config_file}")
+                LOG.warning("Config file not found: %s", config_file)
                 return
 
             with open(config_file, 'r', encoding='utf-8') as f:
-                if config_file.lower().endswith('.yaml') or config_file.lower().endswith('.yml'):
-                    config = yaml.safe_load(f)
-                elif config_file.lower().endswith('.json'):
-                    config = json.load(f)
+                suffix = config_file.lower()
+                if suffix.endswith(('.yaml', '.yml')):
+                    config = _load_yaml(f)
+                elif suffix.endswith('.json'):
+                    config = _load_json(f.read())
                 else:
-                    LOG.warning(f"Unsupported config file format: {config_file}")
+                    LOG.warning("Unsupported config file format: %s", config_file)
                     return
 
                 # Apply configuration settings
@@ -69,25 +85,28 @@ class Settings:
                 self.influxdb_token = config.get('influxdb_token')
                 self.tls_ca = config.get('tls_ca')
 
-                LOG.info(f"Loaded configuration from {config_file}")
+                LOG.info("Loaded configuration from %s", config_file)
 
         except Exception as e:
-            LOG.error(f"Failed to load config from {config_file}: {e}")
+            LOG.error("Failed to load config from %s: %s", config_file, e)
 
     def _load_from_env(self) -> None:
         """Load settings from environment variables."""
+        env = os.environ
+
         # API Configuration - use actual env vars from .env and docker-compose
-        if os.getenv('API'):
+        api = env.get('API')
+        if api:
             # API can be space-separated list like "2.2.2.2 3.3.3.3"
-            self.api = os.getenv('API', '').split()
+            self.api = api.split()
 
-        self.username = os.getenv('SANTRICITY_USERNAME', self.username)
-        self.password = os.getenv('SANTRICITY_PASSWORD', self.password)
+        self.username = env.get('SANTRICITY_USERNAME', self.username)
+        self.password = env.get('SANTRICITY_PASSWORD', self.password)
 
         # InfluxDB Configuration
-        self.influxdb_url = os.getenv('INFLUXDB_URL', self.influxdb_url)
-        self.influxdb_database = os.getenv('INFLUXDB_DATABASE', self.influxdb_database)
-        self.influxdb_token = os.getenv('INFLUXDB_TOKEN', self.influxdb_token)
+        self.influxdb_url = env.get('INFLUXDB_URL', self.influxdb_url)
+        self.influxdb_database = env.get('INFLUXDB_DATABASE', self.influxdb_database)
+        self.influxdb_token = env.get('INFLUXDB_TOKEN', self.influxdb_token)
 
         # TLS Configuration
-        self.tls_ca = os.getenv('TLS_CA', self.tls_ca)
+        self.tls_ca = env.get('TLS_CA', self.tls_ca)
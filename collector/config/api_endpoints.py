@@ -5,8 +5,12 @@ This module contains the definitive API endpoint mappings used by both
 the main collector and the raw API collector to ensure consistency.
 """
 
-# Main API endpoint mappings
-API_ENDPOINTS = {
+from string import Formatter
+from types import MappingProxyType
+from typing import Callable, Dict, Optional
+
+# Main API endpoint mappings (read-only; use build_endpoint() to fill in IDs)
+API_ENDPOINTS = MappingProxyType({
     # System configuration
     'system_config': 'devmgr/v2/storage-systems/{system_id}',
     'controller_config': 'devmgr/v2/storage-systems/{system_id}/controllers',
@@ -60,7 +64,7 @@ API_ENDPOINTS = {
     # ID-dependent endpoints (require parent object IDs)
     'snapshot_groups_repository_utilization': 'devmgr/v2/storage-systems/{system_id}/snapshot-groups/{id}/repository-utilization',
     'volume_expansion_progress': 'devmgr/v2/storage-systems/{system_id}/volumes/{id}/expand',
-}
+})
 
 # ID dependency mapping for endpoints that require parent object IDs
 ID_DEPENDENCIES = {
@@ -79,4 +83,55 @@ ID_DEPENDENCIES = {
         'id_field': 'volumeRef',
         'description': 'Expansion progress for each volume'
     }
-}
\ No newline at end of file
+}
+
+
+def _compile_endpoint(template: str) -> Callable[..., str]:
+    """Specialize an endpoint template into a builder that concatenates its fixed parts."""
+    fields = tuple(field for _, field, _, _ in Formatter().parse(template) if field)
+    if not fields:
+        return lambda system_id, id=None: template
+    if fields == ('system_id',):
+        prefix, suffix = template.split('{system_id}')
+        return lambda system_id, id=None: prefix + str(system_id) + suffix
+    if fields == ('system_id', 'id'):
+        prefix, rest = template.split('{system_id}')
+        middle, suffix = rest.split('{id}')
+        return lambda system_id, id: prefix + str(system_id) + middle + str(id) + suffix
+    return lambda system_id, id=None: template.format(system_id=system_id, id=id)
+
+
+# Endpoint builders, compiled once from API_ENDPOINTS at import
+_ENDPOINT_BUILDERS: Dict[str, Callable[..., str]] = {
+    key: _compile_endpoint(template) for key, template in API_ENDPOINTS.items()
+}
+
+# Endpoints whose template contains {id} and so need a parent object ID
+_ID_ENDPOINTS = frozenset(
+    key for key, template in API_ENDPOINTS.items()
+    if any(field == 'id' for _, field, _, _ in Formatter().parse(template))
+)
+
+
+def build_endpoint(endpoint_key: str, system_id: str, id: Optional[str] = None) -> str:
+    """
+    Build the API path for an endpoint
+
+    Args:
+        endpoint_key: Key from API_ENDPOINTS
+        system_id: Storage system ID substituted for {system_id}
+        id: Parent object ID substituted for {id} (ID-dependent endpoints only)
+
+    Returns:
+        Endpoint path relative to the API base URL
+
+    Raises:
+        KeyError: If endpoint_key is not in API_ENDPOINTS
+        ValueError: If the endpoint needs an {id} and none was given
+    """
+    builder = _ENDPOINT_BUILDERS[endpoint_key]
+    if id is None:
+        if endpoint_key in _ID_ENDPOINTS:
+            raise ValueError(f"Endpoint '{endpoint_key}' requires an id")
+        return builder(system_id)
+    return builder(system_id, id)
@@ -6,10 +6,13 @@ This module defines collection schedules for different types of configuration da
 allowing fine-grained control over how frequently different config objects are collected.
 """
 
+from array import array
 from enum import Enum
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Tuple
 import logging
+import math
+from types import MappingProxyType
 
 LOG = logging.getLogger(__name__)
 
@@ -33,9 +36,12 @@ FREQUENCY_MULTIPLIERS = {
     ScheduleFrequency.WEEKLY: 10080          # 7 days at 60s base, 35 days at 300s base
 }
 
-@dataclass
+# Longest schedule multiplier; FREQUENCY_MULTIPLIERS is static, so compute it once
+MAX_FREQUENCY_MULTIPLIER = max(FREQUENCY_MULTIPLIERS.values())
+
+@dataclass(slots=True, frozen=True)
 class CollectionSchedule:
-    """Definition of a collection schedule with iteration-based timing"""
+    """Definition of a collection schedule with iteration-based timing (immutable)"""
     name: str
     frequency: ScheduleFrequency
     multiplier: int
@@ -88,43 +94,51 @@ def create_collection_schedules(base_interval: int) -> Dict[ScheduleFrequency, C
 
     return schedules
 
-# Configuration object to schedule mapping
-CONFIG_COLLECTION_MAPPING = {
+# Configuration object to schedule mapping (read-only; tuples keep collection order stable)
+CONFIG_COLLECTION_MAPPING = MappingProxyType({
     # High frequency - rapidly changing performance-related configs
-    ScheduleFrequency.HIGH_FREQUENCY: [
+    ScheduleFrequency.HIGH_FREQUENCY: (
         "VolumeConfig",           # Volume counts and mappings can change frequently
         "VolumeMappingsConfig",   # Host access to volumes changes moderately
         "HostConfig",             # Host additions/removals happen moderately
-    ],
+    ),
 
     # Medium frequency - moderately changing configuration
-    ScheduleFrequency.MEDIUM_FREQUENCY: [
+    ScheduleFrequency.MEDIUM_FREQUENCY: (
         "StoragePoolConfig",      # Pool utilization changes, but not rapidly
         "HostGroupsConfig",       # Host group membership changes occasionally
         # "SnapshotConfig",         # TODO: Snapshot configurations - complex enrichment needed
         "VolumeCGMembersConfig",  # Consistency groups rarely change on E-Series, check infrequently
         "DriveConfig",            # Drive configuration changes slowly
-    ],
+    ),
 
     # Low frequency - slowly changing hardware/system config
-    ScheduleFrequency.LOW_FREQUENCY: [
+    ScheduleFrequency.LOW_FREQUENCY: (
         "SystemConfig",           # System-level settings change infrequently
         "ControllerConfig",       # Controller status/interfaces change occasionally
         "EthernetConfig",         # Ethernet interface configs change infrequently
         "AsyncMirrorsConfig",     # Async mirror configurations change infrequently
-    ],
+    ),
 
     # Daily - very static configuration
-    ScheduleFrequency.DAILY: [
+    ScheduleFrequency.DAILY: (
         "HardwareConfig",         # Hardware component configs are static
         "InterfaceConfig",        # Interface config changes weekly at most
         "TrayConfig",             # DEBUG: Tray configuration rarely changes
-    ],
+    ),
 
     # Weekly - essentially static data (mainly for auditing)
-    ScheduleFrequency.WEEKLY: [
+    ScheduleFrequency.WEEKLY: (
+
+    )
+})
 
-    ]
+# Dense integer id per scheduled config type, used to index last-collection arrays
+_CONFIG_TYPE_IDS: Dict[str, int] = {
+    config_type: config_id
+    for config_id, config_type in enumerate(
+        config_type for config_types in CONFIG_COLLECTION_MAPPING.values() for config_type in config_types
+    )
 }
 
 class ConfigCollectionScheduler:
@@ -142,7 +156,39 @@ class ConfigCollectionScheduler:
         self.base_interval = base_interval
         self.schedules = create_collection_schedules(base_interval)
         self.iteration_count = 0
-        self.last_collection_iterations: Dict[str, int] = {}
+        # Last collection iteration per config type, indexed by config type id; types that
+        # are not in CONFIG_COLLECTION_MAPPING get ids appended on first use
+        self._config_type_ids: Dict[str, int] = dict(_CONFIG_TYPE_IDS)
+        self.last_collection_iterations = array('Q', [0]) * len(_CONFIG_TYPE_IDS)
+
+        # Reverse index: config type -> schedule frequency
+        self._config_to_frequency: Dict[str, ScheduleFrequency] = {
+            config_type: frequency
+            for frequency, config_types in CONFIG_COLLECTION_MAPPING.items()
+            for config_type in config_types
+        }
+
+        # (frequency, multiplier, config_types) ordered by multiplier; empty buckets are dropped
+        self._buckets = tuple(sorted(
+            ((frequency, self.schedules[frequency].multiplier, config_types)
+             for frequency, config_types in CONFIG_COLLECTION_MAPPING.items() if config_types),
+            key=lambda bucket: bucket[1]
+        ))
+
+        # Which buckets fire repeats every lcm(multipliers) iterations, so precompute a
+        # bitmask per position in that cycle and the (frequency, config_types) pairs per mask
+        self._cycle = math.lcm(*(multiplier for _, multiplier, _ in self._buckets)) if self._buckets else 1
+        fire_table = [0] * self._cycle
+        for bit, (_, multiplier, _) in enumerate(self._buckets):
+            for position in range(0, self._cycle, multiplier):
+                fire_table[position] |= 1 << bit
+        self._fire_table = tuple(fire_table)
+        self._fire_patterns: Dict[int, Tuple[Tuple[ScheduleFrequency, Tuple[str, ...], Tuple[int, ...]], ...]] = {
+            mask: tuple((frequency, config_types, tuple(_CONFIG_TYPE_IDS[config_type] for config_type in config_types))
+                        for bit, (frequency, _, config_types) in enumerate(self._buckets)
+                        if mask & (1 << bit))
+            for mask in set(fire_table)
+        }
 
     def increment_iteration(self):
         """Call this at the start of each main collection loop"""
@@ -171,18 +217,36 @@ class ConfigCollectionScheduler:
 
         if should_collect:
             # Update last collection iteration
-            self.last_collection_iterations[config_type] = self.iteration_count
+            self.last_collection_iterations[self._config_type_id(config_type)] = self.iteration_count
 
         return should_collect, schedule_frequency
 
+    def _config_type_id(self, config_type: str) -> int:
+        """Return the last-collection array index for a config type, assigning one if new"""
+        config_id = self._config_type_ids.get(config_type)
+        if config_id is None:
+            config_id = self._config_type_ids[config_type] = len(self.last_collection_iterations)
+            self.last_collection_iterations.append(0)
+        return config_id
+
+    def get_last_collection(self, config_type: str) -> int:
+        """
+        Get the iteration on which a config type was last collected
+
+        Args:
+            config_type: Name of the configuration class (e.g., "SystemConfig")
+
+        Returns:
+            Iteration number, or 0 if it has not been collected (or was forced)
+        """
+        config_id = self._config_type_ids.get(config_type)
+        return 0 if config_id is None else self.last_collection_iterations[config_id]
+
     def _get_schedule_for_config(self, config_type: str) -> Optional[ScheduleFrequency]:
         """Find the schedule frequency for a given config type"""
-        for frequency, config_types in CONFIG_COLLECTION_MAPPING.items():
-            if config_type in config_types:
-                return frequency
-        return None
+        return self._config_to_frequency.get(config_type)
 
-    def get_config_types_for_collection(self) -> Dict[ScheduleFrequency, List[str]]:
+    def get_config_types_for_collection(self) -> Dict[ScheduleFrequency, Tuple[str, ...]]:
         """
         Get all config types that should be collected on this iteration, grouped by frequency
 
@@ -190,33 +254,29 @@ class ConfigCollectionScheduler:
         baseline in InfluxDB for downstream users (dashboards, alerts, etc.)
 
         Returns:
-            Dictionary mapping frequencies to lists of config types to collect
+            Dictionary mapping frequencies to (read-only) tuples of config types to collect
         """
         collections_needed = {}
 
         # FIRST ITERATION CHECKPOINT: Collect ALL config types to establish baseline
         if self.iteration_count == 1:
             LOG.info("First iteration checkpoint: collecting ALL config types for InfluxDB baseline")
-            for frequency, config_types in CONFIG_COLLECTION_MAPPING.items():
-                collections_needed[frequency] = config_types.copy()
-                # Update tracking for all types
-                for config_type in config_types:
-                    self.last_collection_iterations[config_type] = self.iteration_count
+            # Mapping values are immutable tuples, so they are returned without copying
+            collections_needed = dict(CONFIG_COLLECTION_MAPPING)
+            # Update tracking for all types
+            last_collections = self.last_collection_iterations
+            for config_id in range(len(_CONFIG_TYPE_IDS)):
+                last_collections[config_id] = self.iteration_count
             return collections_needed
 
         # NORMAL SCHEDULING: Follow regular frequency-based collection
-        for frequency, config_types in CONFIG_COLLECTION_MAPPING.items():
-            schedule = self.schedules[frequency]
-            types_to_collect = []
-
-            if schedule.should_collect_on_iteration(self.iteration_count):
-                for config_type in config_types:
-                    types_to_collect.append(config_type)
-                    # Update tracking
-                    self.last_collection_iterations[config_type] = self.iteration_count
-
-            if types_to_collect:
-                collections_needed[frequency] = types_to_collect
+        iteration = self.iteration_count
+        last_collections = self.last_collection_iterations
+        for frequency, config_types, config_ids in self._fire_patterns[self._fire_table[iteration % self._cycle]]:
+            collections_needed[frequency] = config_types
+            # Update tracking
+            for config_id in config_ids:
+                last_collections[config_id] = iteration
 
         return collections_needed
 
@@ -229,10 +289,12 @@ class ConfigCollectionScheduler:
         """
         if config_type:
             # Reset last collection iteration to force collection
-            self.last_collection_iterations[config_type] = 0
+            config_id = self._config_type_ids.get(config_type)
+            if config_id is not None:
+                self.last_collection_iterations[config_id] = 0
         else:
             # Reset all collection iterations
-            self.last_collection_iterations.clear()
+            self.last_collection_iterations = array('Q', [0]) * len(self.last_collection_iterations)
 
     def get_schedule_info(self) -> Dict[str, Dict]:
         """
@@ -252,7 +314,7 @@ class ConfigCollectionScheduler:
                 'description': schedule.description,
                 'config_types': config_types,
                 'last_collections': {
-                    config_type: self.last_collection_iterations.get(config_type, 0)
+                    config_type: self.get_last_collection(config_type)
                     for config_type in config_types
                 }
             }
@@ -10,8 +10,12 @@ This module categorizes E-Series API endpoints into three main types:
 Each category has different collection patterns and storage requirements.
 """
 
+from bisect import bisect_left
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Set, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Set, Tuple
 
 class EndpointCategory(Enum):
     """Categories for API endpoint collection"""
@@ -20,11 +24,11 @@ class EndpointCategory(Enum):
     EVENTS = "events"               # Dynamic status/jobs, immediate write to DB
     ENVIRONMENTAL = "environmental" # Environmental monitoring (power, temperature)
 
-# Endpoint categorization based on tools/collect_items.py
+# Endpoint categorization based on tools/collect_items.py (frozensets: static for the process lifetime)
 ENDPOINT_CATEGORIES = {
 
     # PERFORMANCE: Real-time metrics and statistics
-    EndpointCategory.PERFORMANCE: {
+    EndpointCategory.PERFORMANCE: frozenset({
         'analyzed_volume_statistics',
         'analyzed_drive_statistics',
         'analyzed_system_statistics',
@@ -35,10 +39,10 @@ ENDPOINT_CATEGORIES = {
         'performance_data',
         'total_records',
         'status',
-    },
+    }),
 
     # CONFIGURATION: Static/semi-static system configuration
-    EndpointCategory.CONFIGURATION: {
+    EndpointCategory.CONFIGURATION: frozenset({
         # System-level configuration
         'system_config',
         'controller_config',
@@ -70,10 +74,10 @@ ENDPOINT_CATEGORIES = {
         # ID-dependent configuration endpoints
         'snapshot_groups_repository_utilization',
         'volume_expansion_progress',
-    },
+    }),
 
     # EVENTS: Dynamic status, jobs, alerts, and transient events
-    EndpointCategory.EVENTS: {
+    EndpointCategory.EVENTS: frozenset({
         # System status and events
         'system_failures',
         'lockdown_status',
@@ -91,16 +95,30 @@ ENDPOINT_CATEGORIES = {
 
         # Alert and failure information
         # Note: Add more event-type endpoints here as discovered
-    },
+    }),
 
     # ENVIRONMENTAL: Environmental monitoring (power, temperature)
-    EndpointCategory.ENVIRONMENTAL: {
+    EndpointCategory.ENVIRONMENTAL: frozenset({
         # Environmental monitoring (Symbol API) - operational time-series metrics
         'env_power',
         'env_temperature',
-    }
+    })
 }
 
+# Inverted index: endpoint -> category. An endpoint listed in more than one category
+# (e.g. 'volume_expansion_progress') resolves to the first, as a scan of ENDPOINT_CATEGORIES
+# would, so categories are inserted last-to-first and earlier ones overwrite later ones.
+# Like the other precomputed tables below, it is wrapped read-only.
+ENDPOINT_CATEGORY_MAP: Mapping[str, EndpointCategory] = MappingProxyType({
+    endpoint: category
+    for category, endpoints in reversed(ENDPOINT_CATEGORIES.items())
+    for endpoint in endpoints
+})
+
+def _lookup_category(endpoint_name: str) -> Optional[EndpointCategory]:
+    """Return the category for an endpoint name, or None if it is not categorized"""
+    return ENDPOINT_CATEGORY_MAP.get(endpoint_name)
+
 def get_endpoint_category(endpoint_name: str) -> EndpointCategory:
     """
     Get the category for a given endpoint name
@@ -114,13 +132,12 @@ def get_endpoint_category(endpoint_name: str) -> EndpointCategory:
     Raises:
         ValueError: If endpoint is not categorized
     """
-    for category, endpoints in ENDPOINT_CATEGORIES.items():
-        if endpoint_name in endpoints:
-            return category
+    category = _lookup_category(endpoint_name)
+    if category is None:
+        raise ValueError(f"Endpoint '{endpoint_name}' is not categorized")
+    return category
 
-    raise ValueError(f"Endpoint '{endpoint_name}' is not categorized")
-
-def get_endpoints_by_category(category: EndpointCategory) -> Set[str]:
+def get_endpoints_by_category(category: EndpointCategory) -> FrozenSet[str]:
     """
     Get all endpoints for a specific category
 
@@ -130,19 +147,37 @@ def get_endpoints_by_category(category: EndpointCategory) -> Set[str]:
     Returns:
         Set of endpoint names in that category
     """
-    return ENDPOINT_CATEGORIES.get(category, set())
+    return ENDPOINT_CATEGORIES.get(category, frozenset())
+
+# Union of all category sets, built once at import
+_ALL_CATEGORIZED: FrozenSet[str] = frozenset().union(*ENDPOINT_CATEGORIES.values())
+_CATEGORIZED_SORTED: Tuple[str, ...] = tuple(sorted(_ALL_CATEGORIZED))
 
-def get_all_categorized_endpoints() -> Set[str]:
+def get_all_categorized_endpoints() -> FrozenSet[str]:
     """
     Get all endpoints that have been categorized
 
     Returns:
-        Set of all categorized endpoint names
+        Frozen set of all categorized endpoint names (shared; copy with set() to modify)
     """
-    all_endpoints = set()
-    for endpoints in ENDPOINT_CATEGORIES.values():
-        all_endpoints.update(endpoints)
-    return all_endpoints
+    return _ALL_CATEGORIZED
+
+def get_endpoints_with_prefix(prefix: str) -> Tuple[str, ...]:
+    """
+    Get all categorized endpoints whose name starts with a prefix (e.g. 'env_')
+
+    Args:
+        prefix: Endpoint name prefix
+
+    Returns:
+        Sorted tuple of matching endpoint names
+    """
+    # Matches form one contiguous run of the sorted endpoint tuple
+    start = bisect_left(_CATEGORIZED_SORTED, prefix)
+    end = start
+    while end < len(_CATEGORIZED_SORTED) and _CATEGORIZED_SORTED[end].startswith(prefix):
+        end += 1
+    return _CATEGORIZED_SORTED[start:end]
 
 def validate_endpoint_coverage(all_known_endpoints: Set[str]) -> Dict[str, List[str]]:
     """
@@ -154,17 +189,17 @@ def validate_endpoint_coverage(all_known_endpoints: Set[str]) -> Dict[str, List[
     Returns:
         Dictionary with 'categorized' and 'uncategorized' lists
     """
-    categorized = get_all_categorized_endpoints()
-    uncategorized = all_known_endpoints - categorized
+    uncategorized = all_known_endpoints - _ALL_CATEGORIZED
 
     return {
-        'categorized': sorted(list(categorized)),
-        'uncategorized': sorted(list(uncategorized))
+        # The categorized half is static: copy the pre-sorted tuple instead of re-sorting
+        'categorized': list(_CATEGORIZED_SORTED),
+        'uncategorized': sorted(uncategorized)
     }
 
-# Collection behavior definitions
+# Collection behavior definitions (read-only mappings)
 COLLECTION_BEHAVIORS = {
-    EndpointCategory.PERFORMANCE: {
+    EndpointCategory.PERFORMANCE: MappingProxyType({
         'typical_frequency': 'FREQUENT_REFRESH',  # Every 5 minutes
         'write_immediately': True,     # Write to DB immediately
         'cache_data': False,           # Don't cache performance data
@@ -172,17 +207,17 @@ COLLECTION_BEHAVIORS = {
         'export_prometheus': True,     # Export via Prometheus
         'enable_enrichment': True,     # Performance data is always enriched
         'enrichment_type': 'performance',  # Use performance enrichment pipeline
-    },
+    }),
 
-    EndpointCategory.CONFIGURATION: {
+    EndpointCategory.CONFIGURATION: MappingProxyType({
         'typical_frequency': 'STANDARD_REFRESH',  # Every 10 minutes
         'write_immediately': False,    # Cache and write periodically
         'cache_data': True,            # Cache config data for enrichment
         'use_scheduler': True,         # Use scheduling system
         'export_prometheus': False,    # Don't export via Prometheus (too static)
-    },
+    }),
 
-    EndpointCategory.EVENTS: {
+    EndpointCategory.EVENTS: MappingProxyType({
         'typical_frequency': 'FREQUENT_REFRESH',  # Check every 5 minutes
         'write_immediately': True,     # Write to DB immediately when data exists
         'cache_data': False,           # Don't cache event data
@@ -194,9 +229,9 @@ COLLECTION_BEHAVIORS = {
         'enable_deduplication': True,  # Enable event deduplication
         'dedup_window_minutes': 5,     # Deduplication window in minutes
         'enable_grafana_annotations': False,  # Optional Grafana annotation integration
-    },
+    }),
 
-    EndpointCategory.ENVIRONMENTAL: {
+    EndpointCategory.ENVIRONMENTAL: MappingProxyType({
         'typical_frequency': 'FREQUENT_REFRESH',  # Every 5 minutes (like performance)
         'write_immediately': True,     # Write to DB immediately
         'cache_data': False,           # Don't cache environmental data
@@ -204,10 +239,33 @@ COLLECTION_BEHAVIORS = {
         'export_prometheus': True,     # Export via Prometheus (important for monitoring)
         'enable_enrichment': True,     # Environmental data needs enrichment (power/temp processing)
         'enrichment_type': 'environmental',  # Use environmental enrichment pipeline
-    }
+    })
 }
 
-def get_collection_behavior(category: EndpointCategory) -> Dict[str, Any]:
+@dataclass(slots=True, frozen=True)
+class BehaviorRecord:
+    """Typed, immutable view of one category's COLLECTION_BEHAVIORS entry"""
+    typical_frequency: str = ''
+    write_immediately: bool = False
+    cache_data: bool = False
+    use_scheduler: bool = False
+    export_prometheus: bool = False
+    write_only_when_data: bool = False
+    enable_enrichment: bool = False
+    enrichment_type: str = 'unknown'
+    enable_deduplication: bool = False
+    dedup_window_minutes: int = 0
+    enable_grafana_annotations: bool = False
+
+# Category -> BehaviorRecord, built once from COLLECTION_BEHAVIORS
+_BEHAVIOR_RECORDS: Mapping[EndpointCategory, BehaviorRecord] = MappingProxyType({
+    category: BehaviorRecord(**behavior) for category, behavior in COLLECTION_BEHAVIORS.items()
+})
+
+# Returned for categories without a behavior definition
+_NO_BEHAVIOR = BehaviorRecord()
+
+def get_collection_behavior(category: EndpointCategory) -> BehaviorRecord:
     """
     Get the collection behavior configuration for a category
 
@@ -215,9 +273,26 @@ def get_collection_behavior(category: EndpointCategory) -> Dict[str, Any]:
         category: The endpoint category
 
     Returns:
-        Dictionary with collection behavior settings
+        BehaviorRecord with collection behavior settings (all False/empty for unknown categories)
     """
-    return COLLECTION_BEHAVIORS.get(category, {})
+    return _BEHAVIOR_RECORDS.get(category, _NO_BEHAVIOR)
+
+def export_prometheus_for(category: EndpointCategory) -> bool:
+    """Whether data in a category is exported via Prometheus"""
+    return _BEHAVIOR_RECORDS.get(category, _NO_BEHAVIOR).export_prometheus
+
+def write_immediately_for(category: EndpointCategory) -> bool:
+    """Whether data in a category is written to the DB immediately"""
+    return _BEHAVIOR_RECORDS.get(category, _NO_BEHAVIOR).write_immediately
+
+def cache_data_for(category: EndpointCategory) -> bool:
+    """Whether data in a category is cached"""
+    return _BEHAVIOR_RECORDS.get(category, _NO_BEHAVIOR).cache_data
+
+# Endpoint -> behavior of its category, fusing the category and behavior lookups
+_ENDPOINT_TO_BEHAVIOR: Mapping[str, BehaviorRecord] = MappingProxyType({
+    endpoint: get_collection_behavior(category) for endpoint, category in ENDPOINT_CATEGORY_MAP.items()
+})
 
 # Centralized endpoint to measurement name mapping
 # This is the SINGLE SOURCE OF TRUTH for all API endpoint -> measurement name transformations
@@ -243,9 +318,8 @@ ENDPOINT_TO_MEASUREMENT_MAPPING = {
     'analyzed_interface_statistics': 'performance_interface_statistics',
     'analyzed_controller_statistics': 'performance_controller_statistics',
 
-    # Environmental endpoints (already correctly named)
-    'env_power': 'env_power',
-    'env_temperature': 'env_temperature',
+    # Environmental endpoints (env_power, env_temperature) are already correctly named:
+    # identity mappings are implicit via the .get(name, name) default and are not listed
 
     # Configuration endpoints (API names -> clean config_<object> measurement names)
     'system_config': 'config_system',
@@ -264,6 +338,31 @@ ENDPOINT_TO_MEASUREMENT_MAPPING = {
     'snapshot_schedules': 'config_snapshot_schedules',
 }
 
+# Reverse of ENDPOINT_TO_MEASUREMENT_MAPPING, built once at import
+_MEASUREMENT_TO_ENDPOINT: Mapping[str, str] = MappingProxyType(
+    {v: k for k, v in ENDPOINT_TO_MEASUREMENT_MAPPING.items()}
+)
+
+
+def _build_export_prometheus_names() -> frozenset:
+    """
+    Resolve the Prometheus export decision for every known endpoint and measurement name
+
+    A categorized endpoint name uses its own category; otherwise a measurement name
+    uses the category of the endpoint it maps back to. Uncategorized names never export.
+    """
+    names = set()
+    for name in set(_ENDPOINT_TO_BEHAVIOR) | set(_MEASUREMENT_TO_ENDPOINT):
+        behavior = _ENDPOINT_TO_BEHAVIOR.get(name)
+        if behavior is None:
+            behavior = _ENDPOINT_TO_BEHAVIOR.get(_MEASUREMENT_TO_ENDPOINT.get(name), _NO_BEHAVIOR)
+        if behavior.export_prometheus:
+            names.add(name)
+    return frozenset(names)
+
+# Every endpoint/measurement name that should_export_to_prometheus() accepts
+_EXPORT_PROMETHEUS_NAMES = _build_export_prometheus_names()
+
 def get_measurement_name(endpoint_name: str) -> str:
     """
     Get the canonical measurement name for an API endpoint
@@ -274,7 +373,8 @@ def get_measurement_name(endpoint_name: str) -> str:
     Returns:
         Canonical measurement name for internal processing and storage
     """
-    return ENDPOINT_TO_MEASUREMENT_MAPPING.get(endpoint_name, endpoint_name)
+    info = _ENDPOINT_INFO.get(endpoint_name)
+    return endpoint_name if info is None else info.measurement
 
 def get_endpoint_from_measurement(measurement_name: str) -> str:
     """
@@ -286,9 +386,43 @@ def get_endpoint_from_measurement(measurement_name: str) -> str:
     Returns:
         Original API endpoint name, or measurement_name if no mapping exists
     """
-    # Create reverse mapping
-    reverse_mapping = {v: k for k, v in ENDPOINT_TO_MEASUREMENT_MAPPING.items()}
-    return reverse_mapping.get(measurement_name, measurement_name)
+    return _MEASUREMENT_TO_ENDPOINT.get(measurement_name, measurement_name)
+
+# JSON replay config types whose endpoint is not '<base>_config', keyed by the
+# lowercased base name (e.g. 'VolumeConfig' -> 'volume')
+CONFIG_TYPE_RENAMES = {
+    'volume': 'volumes_config',
+    'interface': 'interfaces_config',
+    'volumemappings': 'volume_mappings_config',
+    'storagepool': 'storage_pools',
+    'ethernet': 'ethernet_interface_config',
+    'host': 'hosts',                # HostConfig -> hosts
+    'hostgroups': 'host_groups',    # HostGroupsConfig -> host_groups
+}
+
+# Config type keys are a small fixed set per deployment, so each is resolved once
+@lru_cache(maxsize=256)
+def get_endpoint_for_config_type(config_type: str) -> str:
+    """
+    Get the API endpoint name for a collected configuration type
+
+    Handles Live API names ('config_storage_pools' -> 'storage_pools') and
+    JSON replay names ('VolumeConfig' -> 'volumes_config').
+
+    Args:
+        config_type: Configuration type key from collected config data
+
+    Returns:
+        API endpoint name
+    """
+    name = config_type.lower()
+    if name.startswith('config_'):
+        return name[7:]
+    if name.endswith('config'):
+        base = name[:-6]
+        return CONFIG_TYPE_RENAMES.get(base, f"{base}_config")
+    # Other legacy patterns
+    return name.replace('config', '').lstrip('_')
 
 # Enrichment processor mapping for reference
 # This documents which enrichment processors handle which endpoints
@@ -313,6 +447,57 @@ ENRICHMENT_PROCESSOR_MAPPING = {
     # ... other event endpoints use EventEnrichment
 }
 
+class EndpointInfo(NamedTuple):
+    """Everything derived from the static tables for one endpoint"""
+    category: Optional[EndpointCategory]
+    measurement: str
+    export_prometheus: bool
+    enrich: bool
+    processor: Optional[str]      # Resolved processor class name, None if not enriched
+    write_immediately: bool
+
+def _build_endpoint_info() -> Dict[str, EndpointInfo]:
+    """Join the category, behavior, measurement and enrichment tables per endpoint"""
+    info = {}
+    for endpoint in (ENDPOINT_CATEGORY_MAP.keys() | ENDPOINT_TO_MEASUREMENT_MAPPING.keys()
+                     | ENRICHMENT_PROCESSOR_MAPPING.keys()):
+        category = _lookup_category(endpoint)
+        behavior = _ENDPOINT_TO_BEHAVIOR.get(endpoint, _NO_BEHAVIOR)
+        enrich = behavior.enable_enrichment
+        processor = ENRICHMENT_PROCESSOR_MAPPING.get(endpoint)
+        if not processor and enrich:
+            # Category-level enrichment
+            processor = f"{behavior.enrichment_type.title()}Enrichment"
+        info[endpoint] = EndpointInfo(
+            category=category,
+            measurement=ENDPOINT_TO_MEASUREMENT_MAPPING.get(endpoint, endpoint),
+            export_prometheus=behavior.export_prometheus,
+            enrich=enrich,
+            processor=processor or None,
+            write_immediately=behavior.write_immediately,
+        )
+    return info
+
+# Endpoint -> EndpointInfo, so each routing decision is a single lookup
+_ENDPOINT_INFO: Mapping[str, EndpointInfo] = MappingProxyType(_build_endpoint_info())
+
+# Endpoint -> resolved enrichment processor, for endpoints that are enriched
+_RESOLVED_PROCESSOR: Mapping[str, str] = MappingProxyType({
+    endpoint: info.processor for endpoint, info in _ENDPOINT_INFO.items() if info.processor
+})
+
+def get_endpoint_info(endpoint_name: str) -> Optional[EndpointInfo]:
+    """
+    Get every precomputed routing attribute for an endpoint in one lookup
+
+    Args:
+        endpoint_name: Name of the API endpoint
+
+    Returns:
+        EndpointInfo record, or None if the endpoint is unknown
+    """
+    return _ENDPOINT_INFO.get(endpoint_name)
+
 def get_enrichment_processor(endpoint_name: str) -> str:
     """
     Get the enrichment processor class name for a given endpoint
@@ -326,20 +511,9 @@ def get_enrichment_processor(endpoint_name: str) -> str:
     Raises:
         ValueError: If no enrichment processor is defined for the endpoint
     """
-    processor = ENRICHMENT_PROCESSOR_MAPPING.get(endpoint_name)
-    if not processor:
-        # Check category-level enrichment
-        try:
-            category = get_endpoint_category(endpoint_name)
-            behavior = get_collection_behavior(category)
-            if behavior.get('enable_enrichment'):
-                enrichment_type = behavior.get('enrichment_type', 'unknown')
-                return f"{enrichment_type.title()}Enrichment"
-        except ValueError:
-            pass
-
+    processor = _RESOLVED_PROCESSOR.get(endpoint_name)
+    if processor is None:
         raise ValueError(f"No enrichment processor defined for endpoint '{endpoint_name}'")
-
     return processor
 
 def should_export_to_prometheus(endpoint_or_measurement_name: str) -> bool:
@@ -348,6 +522,7 @@ def should_export_to_prometheus(endpoint_or_measurement_name: str) -> bool:
 
     This function handles both API endpoint names and internal measurement names by using
     the centralized ENDPOINT_TO_MEASUREMENT_MAPPING for consistent routing decisions.
+    The answer for every known name is precomputed in _EXPORT_PROMETHEUS_NAMES.
 
     Args:
         endpoint_or_measurement_name: API endpoint name OR internal measurement name
@@ -355,35 +530,4 @@ def should_export_to_prometheus(endpoint_or_measurement_name: str) -> bool:
     Returns:
         bool: True if should be exported to Prometheus
     """
-    # Try direct endpoint lookup first
-    try:
-        category = get_endpoint_category(endpoint_or_measurement_name)
-        behavior = get_collection_behavior(category)
-        return behavior.get('export_prometheus', False)
-    except ValueError:
-        pass
-
-    # Try reverse lookup from measurement name to endpoint name
-    endpoint_name = get_endpoint_from_measurement(endpoint_or_measurement_name)
-    if endpoint_name != endpoint_or_measurement_name:
-        try:
-            category = get_endpoint_category(endpoint_name)
-            behavior = get_collection_behavior(category)
-            return behavior.get('export_prometheus', False)
-        except ValueError:
-            pass
-
-    # Special handling for direct measurement names that map to categorized endpoints
-    # This handles cases like 'events_system_failures' which should export to Prometheus
-    # because the underlying 'system_failures' endpoint is in EVENTS category
-    for endpoint, measurement in ENDPOINT_TO_MEASUREMENT_MAPPING.items():
-        if measurement == endpoint_or_measurement_name:
-            try:
-                category = get_endpoint_category(endpoint)
-                behavior = get_collection_behavior(category)
-                return behavior.get('export_prometheus', False)
-            except ValueError:
-                continue
-
-    # Final fallback for truly uncategorized items (should be rare with proper categorization)
-    return False
+    return endpoint_or_measurement_name in _EXPORT_PROMETHEUS_NAMES
@@ -1,6 +1,14 @@
 """Core collector package initialization."""
 
-from .collector import MetricsCollector
-from .config import CollectorConfig
+__all__ = ['MetricsCollector', 'CollectorConfig']
 
-__all__ = ['MetricsCollector', 'CollectorConfig']
\ No newline at end of file
+
+def __getattr__(name):
+    # Load MetricsCollector (and its datasource/writer imports) only when first used
+    if name == 'MetricsCollector':
+        from .collector import MetricsCollector
+        return MetricsCollector
+    if name == 'CollectorConfig':
+        from .config import CollectorConfig
+        return CollectorConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,19 +6,153 @@ DataSource pattern architecture.
 
 import logging
 import os
+import queue
+import signal
+import threading
 import time
-from typing import Optional, Dict, Any, List
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import Callable, Optional, Dict, Any, List
 
 from ..datasources.base import DataSource, CollectionResult, CollectionType
 from ..datasources.live_api import LiveAPIDataSource
 from ..datasources.json_replay import JSONReplayDataSource
+from ..cache.config_cache import ConfigCache
+from ..enrichment.processor import EnrichmentProcessor
+from ..writer.factory import WriterFactory
 from ..config.endpoint_categories import (
-    get_endpoint_category, get_enrichment_processor, EndpointCategory,
-    get_collection_behavior, get_endpoints_by_category
+    ENDPOINT_CATEGORY_MAP, get_enrichment_processor, EndpointCategory,
+    get_collection_behavior, get_endpoints_by_category, get_endpoint_for_config_type,
+    get_measurement_name
 )
 from .config import CollectorConfig
 from .writer_config import WriterConfig
 
+# Performance types enriched in parallel
+MAX_ENRICHMENT_WORKERS = 8
+
+# Longest wait for the datasource to signal configuration is ready, in seconds
+CONFIG_READY_TIMEOUT = 30
+# Minimum time between config and other collections when strict_config_settle is set
+CONFIG_SETTLE_SECONDS = 2.0
+
+# Cycles that may wait for the background writer before collection blocks (back-pressure)
+WRITE_QUEUE_SIZE = 2
+
+
+class MockConfigCollector:
+    """Stand-in config collector for EnrichmentProcessor, which only needs its config_cache."""
+
+    def __init__(self, config_cache: ConfigCache):
+        self.config_cache = config_cache
+        # Add mock eseries_collector to prevent enrichment processor loading errors
+        self.eseries_collector = None
+
+
+def _serialize_scalar(obj):
+    return obj
+
+
+def _serialize_isoformat(obj):
+    return obj.isoformat()
+
+
+def _unwrap_model(obj):
+    """Return (True, plain value) for a BaseModel, or (False, placeholder) if it cannot be dumped."""
+    # Try multiple serialization methods
+    for method in ('model_dump', 'dict'):
+        if hasattr(obj, method):
+            try:
+                return True, getattr(obj, method)()
+            except Exception:
+                pass
+    if hasattr(obj, '__dict__'):
+        return True, obj.__dict__
+    return False, f"<BaseModel:{type(obj).__name__}:{str(obj)[:100]}>"
+
+
+def _unwrap_object(obj):
+    """Return (True, attribute dict) for a plain object, or (False, its string form)."""
+    if hasattr(obj, '__dict__') and not isinstance(obj, type):
+        return True, obj.__dict__
+    return False, str(obj)
+
+
+# Exact types copied as-is without a serializer lookup
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Container markers returned by _serializer_for; their items are pushed on the work stack
+_DICT = object()
+_LIST = object()
+_UNWRAPPERS = (_unwrap_model, _unwrap_object)
+
+
+@lru_cache(maxsize=512)
+def _serializer_for(cls: type) -> Any:
+    """Pick the serializer for a type once, instead of probing every object."""
+    if cls is type(None) or issubclass(cls, (str, int, float, bool)):
+        return _serialize_scalar
+    # Enhanced BaseModel detection
+    try:
+        if (hasattr(cls, 'model_dump') or
+            hasattr(cls, 'model_fields') or
+            'BaseModel' in str(cls.__bases__)):
+            return _unwrap_model
+    except Exception:
+        pass
+    if issubclass(cls, dict):
+        return _DICT
+    if issubclass(cls, list):
+        return _LIST
+    if hasattr(cls, 'isoformat'):
+        return _serialize_isoformat
+    return _unwrap_object
+
+
+def _convert_to_serializable(obj, depth=0, max_depth=10):
+    """Convert objects to JSON-serializable format (from app/main.py convert_to_serializable).
+
+    Walks the structure with an explicit work stack of (parent, key, value, depth)
+    entries rather than recursing, filling each output container in place.
+    """
+    root = [None]
+    stack = [(root, 0, obj, depth)]
+    while stack:
+        parent, key, item, level = stack.pop()
+        if level > max_depth:
+            parent[key] = f"<MAX_DEPTH_REACHED:{type(item).__name__}>"
+            continue
+
+        serializer = _serializer_for(type(item))
+        if serializer is _DICT or serializer is _LIST:
+            # Plain scalar children are copied directly; everything else goes on the stack
+            level += 1
+            copy_scalars = level <= max_depth
+            if serializer is _DICT:
+                out = {}
+                children = item.items()
+            else:
+                out = [None] * len(item)
+                children = enumerate(item)
+            parent[key] = out
+            for k, v in children:
+                if copy_scalars and type(v) in _SCALAR_TYPES:
+                    out[k] = v
+                else:
+                    out[k] = None
+                    stack.append((out, k, v, level))
+        elif serializer in _UNWRAPPERS:
+            unwrapped, value = serializer(item)
+            if unwrapped:
+                stack.append((parent, key, value, level + 1))
+            else:
+                parent[key] = value
+        else:
+            parent[key] = serializer(item)
+    return root[0]
+
 
 class MetricsCollector:
     """Main orchestrator for E-Series metrics collection.
@@ -40,6 +174,25 @@ class MetricsCollector:
         self.datasource: Optional[DataSource] = None
         self.writer = None  # Will be initialized on first use
 
+        # Config cache shared by the enrichment processors of every collection cycle
+        self.config_collector = MockConfigCollector(ConfigCache())
+
+        # Background writer used by run_continuous, so writing one cycle overlaps collecting the next
+        self._write_queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        # Background write outcomes; updated by the writer thread only
+        self.write_failures = 0
+        self.last_write_success: Optional[bool] = None
+        self._reported_write_failures = 0
+
+        # Set to stop run_continuous; wakes it immediately from the interval wait
+        self._stop_event = threading.Event()
+
+        # Grafana annotation settings do not change at runtime; read them once
+        self._grafana_url = os.environ.get('GRAFANA_API_URL')
+        self._grafana_token = os.environ.get('GRAFANA_API_TOKEN')
+        self._grafana_enabled = bool(self._grafana_url and self._grafana_token)
+
         # Statistics tracking
         self.collections_completed = 0
         self.last_collection_time: Optional[float] = None
@@ -94,97 +247,79 @@ class MetricsCollector:
 
         # Collect configuration data FIRST (ensures batched reader state is fresh for both JSON replay and live API)
         # Config data is mandatory for proper enrichment
-        try:
-            config_result = self.datasource.collect_configuration_data()
-            results[CollectionType.CONFIGURATION] = config_result
+        results[CollectionType.CONFIGURATION] = self._collect(
+            CollectionType.CONFIGURATION, "Configuration", self.datasource.collect_configuration_data
+        )
+
+        # Wait until the datasource signals its configuration state is complete. With
+        # strict_config_settle, also keep at least CONFIG_SETTLE_SECONDS after config collection.
+        settle_deadline = time.perf_counter() + CONFIG_SETTLE_SECONDS
+        if not self.datasource.wait_for_config_ready(timeout=CONFIG_READY_TIMEOUT):
+            self.logger.warning("Configuration data not ready after %ds - continuing with collection", CONFIG_READY_TIMEOUT)
+        if self.config.strict_config_settle:
+            remaining = settle_deadline - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+
+        # Performance (always enabled for E-Series), event and environmental collections are
+        # independent and I/O-bound, so they run concurrently once configuration is in place
+        collections = [(CollectionType.PERFORMANCE, "Performance", self.datasource.collect_performance_data)]
+        if self.config.include_events:
+            collections.append((CollectionType.EVENTS, "Event", self.datasource.collect_event_data))
+        if self.config.include_environmental:
+            collections.append((CollectionType.ENVIRONMENTAL, "Environmental", self.datasource.collect_environmental_data))
 
-            if config_result.success:
-                self.logger.info("Configuration data collected successfully")
-            else:
-                self.logger.warning(f"Configuration data collection failed: {config_result.error_message}")
-        except Exception as e:
-            self.logger.error(f"Configuration data collection error: {e}")
-            results[CollectionType.CONFIGURATION] = CollectionResult(
-                collection_type=CollectionType.CONFIGURATION,
-                data={},
-                success=False,
-                error_message=str(e)
-            )
+        with ThreadPoolExecutor(max_workers=len(collections)) as executor:
+            futures = [(collection_type, executor.submit(self._collect, collection_type, label, collect))
+                       for collection_type, label, collect in collections]
+            for collection_type, future in futures:
+                results[collection_type] = future.result()
+
+        return results
 
-        # Small delay to ensure configuration data is processed before other collections
-        time.sleep(2)
+    def _collect(self, collection_type: CollectionType, label: str,
+                 collect: Callable[[], CollectionResult]) -> CollectionResult:
+        """Run one datasource collection, converting exceptions into a failed result.
 
-        # Collect performance data (always enabled for E-Series)
-        try:
-            performance_result = self.datasource.collect_performance_data()
-            results[CollectionType.PERFORMANCE] = performance_result
+        Args:
+            collection_type: Type of data being collected
+            label: Capitalized data type name for log messages
+            collect: Datasource collection method
 
-            if performance_result.success:
-                self.logger.info("Performance data collected successfully")
+        Returns:
+            The datasource result, or a failed CollectionResult if it raised
+        """
+        try:
+            result = collect()
+            if result.success:
+                self.logger.info("%s data collected successfully", label)
             else:
-                self.logger.warning(f"Performance data collection failed: {performance_result.error_message}")
+                self.logger.warning("%s data collection failed: %s", label, result.error_message)
+            return result
         except Exception as e:
-            self.logger.error(f"Performance data collection error: {e}")
-            results[CollectionType.PERFORMANCE] = CollectionResult(
-                collection_type=CollectionType.PERFORMANCE,
+            self.logger.error("%s data collection error: %s", label, e)
+            return CollectionResult(
+                collection_type=collection_type,
                 data={},
                 success=False,
                 error_message=str(e)
             )
 
-        # Collect event data if enabled
-        if self.config.include_events:
-            try:
-                event_result = self.datasource.collect_event_data()
-                results[CollectionType.EVENTS] = event_result
-
-                if event_result.success:
-                    self.logger.info("Event data collected successfully")
-                else:
-                    self.logger.warning(f"Event data collection failed: {event_result.error_message}")
-            except Exception as e:
-                self.logger.error(f"Event data collection error: {e}")
-                results[CollectionType.EVENTS] = CollectionResult(
-                    collection_type=CollectionType.EVENTS,
-                    data={},
-                    success=False,
-                    error_message=str(e)
-                )
-
-        # Collect environmental data if enabled
-        if self.config.include_environmental:
-            try:
-                env_result = self.datasource.collect_environmental_data()
-                results[CollectionType.ENVIRONMENTAL] = env_result
-
-                if env_result.success:
-                    self.logger.info("Environmental data collected successfully")
-                else:
-                    self.logger.warning(f"Environmental data collection failed: {env_result.error_message}")
-            except Exception as e:
-                self.logger.error(f"Environmental data collection error: {e}")
-                results[CollectionType.ENVIRONMENTAL] = CollectionResult(
-                    collection_type=CollectionType.ENVIRONMENTAL,
-                    data={},
-                    success=False,
-                    error_message=str(e)
-                )
-
-        return results
-
-    def process_and_write_data(self, collection_results: Dict[CollectionType, CollectionResult]) -> bool:
+    def process_and_write_data(self, collection_results: Dict[CollectionType, CollectionResult]) -> Optional[bool]:
         """Process collected data through enrichment and write to output.
 
+        While run_continuous is running, the data is queued for the background writer
+        instead of being written here. Queued records are handed over to that thread and
+        must not be modified afterwards.
+
         Args:
             collection_results: Results from collect_all_data()
 
         Returns:
-            True if processing/writing successful, False otherwise
+            True if processing/writing successful, False otherwise, or None if the data
+            was queued; its write result is reported by a later cycle and get_statistics()
         """
         try:
-            # Initialize enrichment processor (using local collector enrichment)
-            from ..enrichment.processor import EnrichmentProcessor
-
             # Get system info from datasource
             sys_info = self.datasource.get_system_info() if self.datasource else None
             sys_info_dict = {'name': sys_info.name, 'wwn': sys_info.wwn} if sys_info else {'name': 'unknown', 'wwn': 'unknown'}
@@ -203,18 +338,17 @@ class MetricsCollector:
                 perf_result = collection_results[CollectionType.PERFORMANCE]
                 if perf_result.success and perf_result.data:
                     perf_result_data = perf_result.data
-                    self.logger.info(f"Performance data extracted: {list(perf_result_data.keys()) if perf_result_data else 'empty'}")
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info("Performance data extracted: %s", list(perf_result_data.keys()) if perf_result_data else 'empty')
 
-            # Merge environmental data with performance data for processing
+            # Extract environmental data; it goes through the performance pipeline without enrichment
+            env_result_data = None
             if CollectionType.ENVIRONMENTAL in collection_results:
                 env_result = collection_results[CollectionType.ENVIRONMENTAL]
                 if env_result.success and env_result.data:
-                    env_data = env_result.data
-                    self.logger.info(f"Environmental data extracted: {list(env_data.keys()) if env_data else 'empty'}")
-                    if perf_result_data is None:
-                        perf_result_data = {}
-                    perf_result_data.update(env_data)
-                    self.logger.info(f"Merged environmental data into performance processing pipeline")
+                    env_result_data = env_result.data
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info("Environmental data extracted: %s", list(env_result_data.keys()))
 
             # Extract configuration data (from app/main.py lines 1720-1780)
             config_data = None
@@ -222,66 +356,68 @@ class MetricsCollector:
                 config_result = collection_results[CollectionType.CONFIGURATION]
                 if config_result.success:
                     config_data = config_result.data
-                    self.logger.info(f"Configuration data extracted: {list(config_data.keys()) if config_data else 'empty'}")
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info("Configuration data extracted: %s", list(config_data.keys()) if config_data else 'empty')
 
             # Create enrichment processor with config data now that it's available
-            # Create a mock config collector for enrichment processor
-            class MockConfigCollector:
-                def __init__(self):
-                    from ..cache.config_cache import ConfigCache
-                    self.config_cache = ConfigCache()
-                    # Add mock eseries_collector to prevent enrichment processor loading errors
-                    self.eseries_collector = None
-
             # Initialize enrichment processor with pre-collected config data
             enrichment_processor = EnrichmentProcessor(
-                MockConfigCollector(),
+                self.config_collector,
                 from_json=self.config.use_json_replay,
                 sys_info=sys_info_dict,
                 config_data=config_data  # Pass the collected config data
             )
-            self.logger.info(f"EnrichmentProcessor created with config_data: {list(config_data.keys()) if config_data else 'None'}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("EnrichmentProcessor created with config_data: %s", list(config_data.keys()) if config_data else 'None')
 
             # Now process performance data with the enrichment processor
-            if perf_result_data:
+            if perf_result_data or env_result_data:
                 self.logger.info("Processing and enriching performance data...")
 
-                # Process each performance type separately
-                for perf_type, perf_records in perf_result_data.items():
-                    if isinstance(perf_records, list) and len(perf_records) > 0:
-                        # Skip environmental data from performance enrichment - temp=128.0 means "sensor OK status"
-                        if perf_type.startswith('env_'):
-                            self.logger.info(f"Skipping enrichment for environmental data: {perf_type} ({len(perf_records)} records)")
-                            enriched_data[perf_type] = perf_records
+                # Process each performance type separately; types are independent, so they are
+                # enriched concurrently and collected back in their original order.
+                # Environmental types follow the performance types unchanged - temp=128.0 means "sensor OK status"
+                with ThreadPoolExecutor(max_workers=MAX_ENRICHMENT_WORKERS) as executor:
+                    for is_env, (perf_type, perf_records) in chain(
+                        zip(repeat(False), (perf_result_data or {}).items()),
+                        zip(repeat(True), (env_result_data or {}).items())
+                    ):
+                        if isinstance(perf_records, list) and len(perf_records) > 0:
+                            if is_env:
+                                self.logger.info("Skipping enrichment for environmental data: %s (%d records)", perf_type, len(perf_records))
+                                enriched_data[perf_type] = perf_records
+                            else:
+                                self.logger.info("Enriching %s: %d records", perf_type, len(perf_records))
+                                enriched_data[perf_type] = executor.submit(
+                                    enrichment_processor.process, perf_records, measurement_type=perf_type
+                                )
+                        elif isinstance(perf_records, list):
+                            self.logger.info("No %s data to enrich (empty list)", perf_type)
                         else:
-                            self.logger.info(f"Enriching {perf_type}: {len(perf_records)} records")
-                            enriched_records = enrichment_processor.process(perf_records, measurement_type=perf_type)
+                            self.logger.warning("Unexpected %s data type: %s", perf_type, type(perf_records))
+
+                    for perf_type, pending in enriched_data.items():
+                        if isinstance(pending, Future):
+                            enriched_records = pending.result()
                             enriched_data[perf_type] = enriched_records
-                            self.logger.info(f"Enriched {perf_type}: {len(enriched_records)} records")
-                    elif isinstance(perf_records, list):
-                        self.logger.info(f"No {perf_type} data to enrich (empty list)")
-                    else:
-                        self.logger.warning(f"Unexpected {perf_type} data type: {type(perf_records)}")
+                            self.logger.info("Enriched %s: %d records", perf_type, len(enriched_records))
 
                 # Environmental data system information is now handled by dedicated enrichment processors
                 # No need for post-enrichment fixes - EnvironmentalPowerEnrichment and EnvironmentalTemperatureEnrichment
                 # handle system metadata injection and sensor type classification directly
 
 
-                self.logger.info(f"Enriched performance data successfully - {len(enriched_data)} performance types processed")
+                self.logger.info("Enriched performance data successfully - %d performance types processed", len(enriched_data))
 
             # Event enrichment is handled by the enrichment_processor.event_enricher
             # No need for a separate EventEnrichment instance
 
             # Configure Grafana integration if environment variables are available
-            if enrichment_processor and enrichment_processor.event_enricher:
-                grafana_url = os.environ.get('GRAFANA_API_URL')
-                grafana_token = os.environ.get('GRAFANA_API_TOKEN')
-                if grafana_url and grafana_token:
-                    enrichment_processor.event_enricher.grafana_api_url = grafana_url
-                    enrichment_processor.event_enricher.grafana_api_token = grafana_token
-                    enrichment_processor.event_enricher.enable_grafana_annotations = True
-                    self.logger.info("Grafana annotations enabled for event enrichment")
+            if self._grafana_enabled and enrichment_processor.event_enricher:
+                enrichment_processor.event_enricher.grafana_api_url = self._grafana_url
+                enrichment_processor.event_enricher.grafana_api_token = self._grafana_token
+                enrichment_processor.event_enricher.enable_grafana_annotations = True
+                self.logger.info("Grafana annotations enabled for event enrichment")
 
             # Extract event data and process through deduplication (from app/main.py lines 1750-1820)
             if CollectionType.EVENTS in collection_results:
@@ -291,8 +427,6 @@ class MetricsCollector:
                     self.logger.info("Event data extracted: %d event types", len(event_data))
 
             # Initialize writer (from app/main.py lines 1140-1155)
-            from ..writer.factory import WriterFactory
-
             # Create writer if not already created and output format requires it
             if not self.writer and self.config.output != 'none':
                 # Use pre-configured WriterConfig if available, otherwise create minimal one
@@ -311,22 +445,13 @@ class MetricsCollector:
             # Prepare writer data using centralized endpoint mapping
             writer_data = {}
 
-            # Helper function to get proper measurement name using centralized config
-            def get_measurement_name(data_type: str) -> str:
-                """Get proper measurement name using centralized endpoint categorization."""
-                # Import centralized system
-                from collector.config.endpoint_categories import get_measurement_name as get_centralized_name
-
-                # Use centralized system for all measurements
-                return get_centralized_name(data_type)
-
             if enriched_data:
                 for perf_type, perf_records in enriched_data.items():
                     if isinstance(perf_records, list) and len(perf_records) > 0:
                         # Use centralized mapping to get correct measurement name
                         measurement_name = get_measurement_name(perf_type)
                         writer_data[measurement_name] = perf_records
-                        self.logger.info(f"Adding {len(perf_records)} {measurement_name} records to write (transformed from {perf_type})")
+                        self.logger.info("Adding %d %s records to write (transformed from %s)", len(perf_records), measurement_name, perf_type)
 
                         # NOTE: Removed duplicate environmental data entry - writers should only see clean measurement names
 
@@ -342,67 +467,31 @@ class MetricsCollector:
                         if config_type.startswith(('config_', 'events_', 'performance_', 'env_', 'snapshot_')):
                             # Already in measurement format, use directly
                             writer_data[config_type] = config_items
-                            self.logger.debug(f"Using config data directly: {config_type}")
+                            self.logger.debug("Using config data directly: %s", config_type)
                             continue
 
                         # Use centralized endpoint categorization to determine routing
-                        # Clean up config_type to get the base endpoint name
-                        endpoint_name = config_type.lower()
-
-                        # Handle Live API format: 'config_storage_pools' -> 'storage_pools'
-                        if endpoint_name.startswith('config_'):
-                            endpoint_name = endpoint_name[7:]  # Remove 'config_' prefix
-
-                        # Handle JSON replay format: 'VolumeConfig' -> 'volumes_config'
-                        elif endpoint_name.endswith('config'):
-                            # Convert camelCase to snake_case with _config suffix
-                            base_name = endpoint_name[:-6]  # Remove 'config' suffix
-
-                            # Handle special case mappings for JSON replay format
-                            if base_name == 'volume':
-                                endpoint_name = 'volumes_config'
-                            elif base_name == 'interface':
-                                endpoint_name = 'interfaces_config'
-                            elif base_name == 'volumemappings':
-                                endpoint_name = 'volume_mappings_config'
-                            elif base_name == 'storagepool':
-                                endpoint_name = 'storage_pools'
-                            elif base_name == 'ethernet':
-                                endpoint_name = 'ethernet_interface_config'
-                            elif base_name == 'host':
-                                endpoint_name = 'hosts'  # HostConfig -> hosts
-                            elif base_name == 'hostgroups':
-                                endpoint_name = 'host_groups'  # HostGroupsConfig -> host_groups
-                            else:
-                                # Generic conversion: add _config suffix
-                                endpoint_name = f"{base_name}_config"
-
-                        # Handle other legacy patterns
+                        endpoint_name = get_endpoint_for_config_type(config_type)
+
+                        category = ENDPOINT_CATEGORY_MAP.get(endpoint_name)
+                        if category == EndpointCategory.EVENTS:
+                            # Route to events using centralized mapping
+                            events_measurement = get_measurement_name(endpoint_name)
+                            writer_data[events_measurement] = config_items
+                            self.logger.info("Routed %s to events as %s", config_type, events_measurement)
+                        elif category is not None:
+                            # Route to config using centralized mapping
+                            config_measurement = get_measurement_name(endpoint_name)
+                            writer_data[config_measurement] = config_items
+                            self.logger.info("Routed %s to config as %s", config_type, config_measurement)
                         else:
-                            endpoint_name = endpoint_name.replace('config', '').replace('statusconfig', '_status')
-                            endpoint_name = endpoint_name.lstrip('_')
-
-                        try:
-                            category = get_endpoint_category(endpoint_name)
-                            if category == EndpointCategory.EVENTS:
-                                # Route to events using centralized mapping
-                                events_measurement = get_measurement_name(endpoint_name)
-                                writer_data[events_measurement] = config_items
-                                self.logger.info(f"Routed {config_type} to events as {events_measurement}")
-                            else:
-                                # Route to config using centralized mapping
-                                config_measurement = get_measurement_name(endpoint_name)
-                                writer_data[config_measurement] = config_items
-                                self.logger.info(f"Routed {config_type} to config as {config_measurement}")
-                        except ValueError:
                             # Fallback for uncategorized endpoints - use legacy pattern
                             fallback_measurement = f"config_{config_type.lower()}"
                             writer_data[fallback_measurement] = config_items
-                            self.logger.debug(f"Using fallback routing for uncategorized config: {config_type} -> {fallback_measurement}")
+                            self.logger.debug("Using fallback routing for uncategorized config: %s -> %s", config_type, fallback_measurement)
 
             # Process event data with deduplication
             if event_data:
-                processed_events = []
                 events_to_process = None
 
                 # Extract events from the event_data structure - handle both dict and direct list
@@ -414,7 +503,8 @@ class MetricsCollector:
                     else:
                         # Direct dict structure with event types as keys (JSON replay format)
                         events_to_process = event_data
-                        self.logger.info(f"Using JSON replay event structure with keys: {list(event_data.keys())}")
+                        if self.logger.isEnabledFor(logging.INFO):
+                            self.logger.info("Using JSON replay event structure with keys: %s", list(event_data.keys()))
                 elif isinstance(event_data, list):
                     # Direct list of events
                     events_to_process = {"events": event_data}
@@ -428,7 +518,7 @@ class MetricsCollector:
                         if isinstance(event_list, list) and event_list:
                             # Skip volume expansion progress events
                             if "volume_expansion_progress" in endpoint_name.lower():
-                                self.logger.info(f"Event {endpoint_name}: {len(event_list)} -> 0 (skipped - mostly inactive data)")
+                                self.logger.info("Event %s: %d -> 0 (skipped - mostly inactive data)", endpoint_name, len(event_list))
                                 continue
 
                             total_events_before += len(event_list)
@@ -438,37 +528,36 @@ class MetricsCollector:
                                 enriched_events = enrichment_processor.enrich_event_data(
                                     event_list, sys_info_dict, endpoint_name=endpoint_name
                                 )
-                                self.logger.info(f"Events processed with full enrichment for {endpoint_name}")
+                                self.logger.info("Events processed with full enrichment for %s", endpoint_name)
 
                                 # Add enriched events to writer data
                                 measurement_name = self._get_event_measurement_name(endpoint_name)
                                 writer_data[measurement_name] = enriched_events
-                                self.logger.info(f"Routed {endpoint_name} to {measurement_name} with enrichment")
+                                self.logger.info("Routed %s to %s with enrichment", endpoint_name, measurement_name)
                             else:
                                 # Fallback to basic system info injection if processor not available
-                                enriched_events = event_list
-                                for event in enriched_events:
-                                    if isinstance(event, dict):
-                                        event.update(sys_info_dict)
-                                self.logger.warning(f"Using basic event enrichment for {endpoint_name} - processor not available")
+                                enriched_events = [
+                                    {**event, **sys_info_dict} if isinstance(event, dict) else event
+                                    for event in event_list
+                                ]
+                                self.logger.warning("Using basic event enrichment for %s - processor not available", endpoint_name)
 
                                 # Use centralized endpoint routing instead of hardcoded mappings
                                 measurement_name = self._get_event_measurement_name(endpoint_name)
                                 writer_data[measurement_name] = enriched_events
-                                self.logger.info(f"Routed {endpoint_name} to {measurement_name} using centralized mapping")
+                                self.logger.info("Routed %s to %s using centralized mapping", endpoint_name, measurement_name)
 
                             # NOTE: Removed duplicate raw endpoint name entry - writers should only see clean measurement names
                             if enriched_events:
-                                processed_events.extend(enriched_events)
                                 total_events_after += len(enriched_events)
-                                self.logger.info(f"Event {endpoint_name}: {len(event_list)} -> {len(enriched_events)} (after dedup)")
+                                self.logger.info("Event %s: %d -> %d (after dedup)", endpoint_name, len(event_list), len(enriched_events))
                             else:
-                                self.logger.info(f"Event {endpoint_name}: {len(event_list)} -> 0 (duplicate/filtered)")
+                                self.logger.info("Event %s: %d -> 0 (duplicate/filtered)", endpoint_name, len(event_list))
 
-                    if processed_events:
-                        self.logger.info(f"Processed {len(processed_events)} total events (filtered from {total_events_before} total)")
+                    if total_events_after:
+                        self.logger.info("Processed %d total events (filtered from %d total)", total_events_after, total_events_before)
                     else:
-                        self.logger.info(f"No events to write after deduplication (filtered {total_events_before} duplicates)")
+                        self.logger.info("No events to write after deduplication (filtered %d duplicates)", total_events_before)
 
             # Write data if any available
             if writer_data:
@@ -478,109 +567,124 @@ class MetricsCollector:
                 for key, value in writer_data.items():
                     clean_measurement_name = get_measurement_name(key)
                     if clean_measurement_name != key:
-                        self.logger.info(f"Early transformation: {key} → {clean_measurement_name}")
+                        self.logger.info("Early transformation: %s → %s", key, clean_measurement_name)
 
-                    # Avoid duplicate keys by using the first occurrence
-                    if clean_measurement_name not in transformed_writer_data:
-                        transformed_writer_data[clean_measurement_name] = value
-                    else:
-                        self.logger.warning(f"Duplicate measurement name {clean_measurement_name} - merging data")
+                    # Avoid duplicate keys by using the first occurrence (one dict lookup per key)
+                    first = transformed_writer_data.setdefault(clean_measurement_name, value)
+                    if first is not value:
                         # If both are lists, merge them
-                        if isinstance(transformed_writer_data[clean_measurement_name], list) and isinstance(value, list):
-                            transformed_writer_data[clean_measurement_name].extend(value)
+                        if isinstance(first, list) and isinstance(value, list):
+                            self.logger.warning("Duplicate measurement name %s - merging data", clean_measurement_name)
+                            first.extend(value)
                         else:
-                            # Keep the first occurrence
-                            pass
+                            self.logger.warning("Duplicate measurement name %s - keeping first occurrence, dropping data from %s", clean_measurement_name, key)
 
                 writer_data = transformed_writer_data
-                self.logger.info(f"Early transformation complete: {len(writer_data)} clean measurement names for writers")
-
-                # Convert data to serializable format (from app/main.py convert_to_serializable)
-                def convert_to_serializable(obj, depth=0, max_depth=10):
-                    """Recursively convert objects to JSON-serializable format."""
-                    if depth > max_depth:
-                        return f"<MAX_DEPTH_REACHED:{type(obj).__name__}>"
-
-                    if obj is None:
-                        return None
-
-                    if isinstance(obj, (str, int, float, bool)):
-                        return obj
-
-                    # Enhanced BaseModel detection
-                    is_basemodel = False
-                    try:
-                        if (hasattr(obj, 'model_dump') or
-                            hasattr(obj, 'model_fields') or
-                            'BaseModel' in str(type(obj).__bases__)):
-                            is_basemodel = True
-                    except Exception:
-                        pass
-
-                    if is_basemodel:
-                        # Try multiple serialization methods
-                        if hasattr(obj, 'model_dump'):
-                            try:
-                                return convert_to_serializable(obj.model_dump(), depth + 1, max_depth)
-                            except Exception:
-                                pass
-                        if hasattr(obj, 'dict'):
-                            try:
-                                return convert_to_serializable(obj.dict(), depth + 1, max_depth)
-                            except Exception:
-                                pass
-                        if hasattr(obj, '__dict__'):
-                            try:
-                                return convert_to_serializable(obj.__dict__, depth + 1, max_depth)
-                            except Exception:
-                                pass
-                        return f"<BaseModel:{type(obj).__name__}:{str(obj)[:100]}>"
-
-                    elif isinstance(obj, dict):
-                        return {key: convert_to_serializable(value, depth + 1, max_depth) for key, value in obj.items()}
-                    elif isinstance(obj, list):
-                        return [convert_to_serializable(item, depth + 1, max_depth) for item in obj]
-                    elif hasattr(obj, 'isoformat'):
-                        return obj.isoformat()
-                    elif hasattr(obj, '__dict__') and not isinstance(obj, type):
-                        return convert_to_serializable(obj.__dict__, depth + 1, max_depth)
-                    else:
-                        return str(obj)
+                self.logger.info("Early transformation complete: %d clean measurement names for writers", len(writer_data))
 
-                # Convert all writer data to serializable format
-                serializable_data = {}
-                for key, value in writer_data.items():
-                    try:
-                        self.logger.info(f"Converting {key} data: {len(value) if hasattr(value, '__len__') else 1} items")
-                        serializable_data[key] = convert_to_serializable(value)
-                        self.logger.info(f"Successfully converted {key} to serializable format")
-                    except Exception as conv_e:
-                        self.logger.error(f"Failed to convert {key}: {conv_e}")
-                        serializable_data[key] = []
-
-                # Write data
-                # Write data if writer is available
-                if self.writer:
-                    success = self.writer.write(serializable_data, self.collections_completed + 1)
+                if self.writer and self.writer.accepts_native:
+                    # The writer converts records itself; skip the serialization pass
+                    serializable_data = writer_data
                 else:
+                    # Convert all writer data to serializable format, one measurement at a time.
+                    # Each source list is released as soon as it is converted (enriched_data held
+                    # the same lists), so only one extra copy of a measurement is alive at once.
+                    enriched_data.clear()
+                    serializable_data = {}
+                    for key in list(writer_data):
+                        value = writer_data.pop(key)
+                        try:
+                            self.logger.info("Converting %s data: %s items", key, len(value) if hasattr(value, '__len__') else 1)
+                            serializable_data[key] = _convert_to_serializable(value)
+                            self.logger.info("Successfully converted %s to serializable format", key)
+                        except Exception as conv_e:
+                            self.logger.error("Failed to convert %s: %s", key, conv_e)
+                            serializable_data[key] = []
+
+                # Write data if writer is available
+                if not self.writer:
                     self.logger.warning("No writer available - skipping data write")
-                    success = False
-                if success:
-                    self.logger.info("Data successfully written to output destination")
-                    return True
-                else:
-                    self.logger.error("Failed to write data to output destination")
                     return False
+                if self._write_queue is not None:
+                    # Hand the writer thread its own measurement dict and lists, so nothing
+                    # still referenced here can change what it writes. Blocks while
+                    # WRITE_QUEUE_SIZE cycles are still waiting to be written.
+                    queued_data = {key: list(value) if isinstance(value, list) else value
+                                   for key, value in serializable_data.items()}
+                    self._write_queue.put((queued_data, self.collections_completed + 1))
+                    self.logger.info("Data queued for background write")
+                    return None
+                return self._write_data(serializable_data, self.collections_completed + 1)
             else:
                 self.logger.info("No data to write")
                 return True
 
         except Exception as e:
-            self.logger.error(f"Failed to process and write data: {e}")
-            import traceback
-            self.logger.debug(f"Process and write traceback: {traceback.format_exc()}")
+            self.logger.error("Failed to process and write data: %s", e)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Process and write traceback: %s", traceback.format_exc())
             return False
 
+    def _write_data(self, data: Dict[str, Any], loop_iteration: int) -> bool:
+        """Write one cycle of measurements with the configured writer.
+
+        Args:
+            data: Measurement name -> records, as produced by process_and_write_data
+            loop_iteration: Iteration number passed through to the writer
+
+        Returns:
+            True if the writer reported success, False otherwise
+        """
+        if self.writer.write(data, loop_iteration):
+            self.logger.info("Data successfully written to output destination")
+            return True
+        self.logger.error("Failed to write data to output destination")
+        return False
+
+    def _start_writer_thread(self) -> None:
+        """Start the background writer that drains cycles queued by process_and_write_data."""
+        self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="collector-writer", daemon=True)
+        self._writer_thread.start()
+
+    def _stop_writer_thread(self) -> None:
+        """Write any queued cycles, then stop the background writer."""
+        if self._writer_thread is None:
+            return
+        self._write_queue.put(None)
+        self._writer_thread.join()
+        self._writer_thread = None
+        self._write_queue = None
+        self._check_background_writes()
+
+    def _check_background_writes(self) -> bool:
+        """Report background write failures since the last check.
+
+        Returns:
+            True if no background write has failed since the last check
+        """
+        failures = self.write_failures - self._reported_write_failures
+        self._reported_write_failures += failures
+        if failures:
+            self.logger.error("%d background write(s) failed since the last check", failures)
+        return failures == 0
+
+    def _writer_loop(self) -> None:
+        """Background writer loop; a None item ends it."""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                return
+            data, loop_iteration = item
+            try:
+                success = self._write_data(data, loop_iteration)
+            except Exception as e:
+                self.logger.error("Background write failed: %s", e)
+                success = False
+            self.last_write_success = success
+            if not success:
+                self.write_failures += 1
+
     def run_single_collection(self) -> bool:
         """Run a single collection cycle.
 
@@ -595,18 +699,21 @@ class MetricsCollector:
 
             # Process and write the collected data
             success = self.process_and_write_data(collection_results)
+            if success is None:
+                # Queued for the background writer; report its failures since the last cycle instead
+                success = self._check_background_writes()
 
             # Update statistics
             self.collections_completed += 1
             self.last_collection_time = time.time()
 
             duration = self.last_collection_time - start_time
-            self.logger.info(f"Collection cycle {self.collections_completed} completed in {duration:.2f}s")
+            self.logger.info("Collection cycle %d completed in %.2fs", self.collections_completed, duration)
 
             return success
 
         except Exception as e:
-            self.logger.error(f"Collection cycle failed: {e}")
+            self.logger.error("Collection cycle failed: %s", e)
             return False
 
     def run_continuous(self) -> None:
@@ -617,33 +724,44 @@ class MetricsCollector:
         Supports max_iterations for graceful exit after N iterations.
         """
         iteration_count = 0
-        self.logger.info(f"Starting continuous collection (interval: {self.config.interval_time}s, max_iterations: {self.config.max_iterations if self.config.max_iterations > 0 else 'unlimited'})")
+        self._stop_event.clear()
+
+        # SIGTERM (e.g. docker stop) ends the loop after the current cycle and still runs cleanup;
+        # SIGINT already interrupts the loop via KeyboardInterrupt
+        previous_sigterm = None
+        if threading.current_thread() is threading.main_thread():
+            previous_sigterm = signal.signal(signal.SIGTERM, self._handle_stop_signal)
+
+        max_iterations_label = self.config.max_iterations if self.config.max_iterations > 0 else 'unlimited'
+        self.logger.info("Starting continuous collection (interval: %ss, max_iterations: %s)", self.config.interval_time, max_iterations_label)
 
         try:
+            self._start_writer_thread()
+
             if self.config.use_json_replay:
                 # JSON replay mode: process all batches
                 batch_count = 0
-                while True:
+                while not self._stop_event.is_set():
                     batch_count += 1
                     iteration_count += 1
 
                     # Check max iterations
                     if self.config.max_iterations > 0 and iteration_count > self.config.max_iterations:
-                        self.logger.info(f"Reached maximum iterations ({self.config.max_iterations}) - exiting")
+                        self.logger.info("Reached maximum iterations (%d) - exiting", self.config.max_iterations)
                         break
 
-                    self.logger.info(f"Processing JSON batch {batch_count}, iteration {iteration_count}")
+                    self.logger.info("Processing JSON batch %d, iteration %d", batch_count, iteration_count)
 
                     success = self.run_single_collection()
                     if not success:
-                        self.logger.warning(f"Batch {batch_count} collection failed")
+                        self.logger.warning("Batch %d collection failed", batch_count)
 
                     self.collections_completed = iteration_count
 
                     # Try to advance to next batch
                     if self.datasource and hasattr(self.datasource, 'advance_batch'):
                         if not self.datasource.advance_batch():
-                            self.logger.info(f"No more JSON batches. Processed {batch_count} batches total.")
+                            self.logger.info("No more JSON batches. Processed %d batches total.", batch_count)
                             break
                     else:
                         self.logger.info("No batch advancement available")
@@ -651,15 +769,15 @@ class MetricsCollector:
 
             else:
                 # Live API mode: continuous collection
-                while True:
+                while not self._stop_event.is_set():
                     iteration_count += 1
 
                     # Check max iterations
                     if self.config.max_iterations > 0 and iteration_count > self.config.max_iterations:
-                        self.logger.info(f"Reached maximum iterations ({self.config.max_iterations}) - exiting")
+                        self.logger.info("Reached maximum iterations (%d) - exiting", self.config.max_iterations)
                         break
 
-                    self.logger.info(f"Starting collection iteration {iteration_count} of {self.config.max_iterations if self.config.max_iterations > 0 else 'unlimited'}")
+                    self.logger.info("Starting collection iteration %d of %s", iteration_count, max_iterations_label)
 
                     success = self.run_single_collection()
                     if not success:
@@ -669,18 +787,30 @@ class MetricsCollector:
 
                     # Wait for next collection (unless this was the final iteration)
                     if self.config.max_iterations == 0 or iteration_count < self.config.max_iterations:
-                        self.logger.info(f"Waiting {self.config.interval_time} seconds until next collection...")
-                        time.sleep(self.config.interval_time)
+                        self.logger.info("Waiting %s seconds until next collection...", self.config.interval_time)
+                        if self._stop_event.wait(self.config.interval_time):
+                            break
                     else:
-                        self.logger.info(f"Completed final iteration {iteration_count} - not waiting for interval")
+                        self.logger.info("Completed final iteration %d - not waiting for interval", iteration_count)
 
         except KeyboardInterrupt:
             self.logger.info("Received interrupt signal, shutting down...")
         except Exception as e:
-            self.logger.error(f"Collection loop error: {e}")
+            self.logger.error("Collection loop error: %s", e)
         finally:
+            if previous_sigterm is not None:
+                signal.signal(signal.SIGTERM, previous_sigterm)
             self.cleanup()
 
+    def stop(self) -> None:
+        """Ask run_continuous to exit, waking it if it is waiting for the next interval."""
+        self._stop_event.set()
+
+    def _handle_stop_signal(self, signum, frame) -> None:
+        """Signal handler that stops the continuous collection loop."""
+        self.logger.info("Received signal %s, stopping after the current collection...", signum)
+        self.stop()
+
     def _get_event_measurement_name(self, endpoint_name: str) -> str:
         """Get the proper measurement name for an event endpoint using centralized mapping.
 
@@ -690,18 +820,9 @@ class MetricsCollector:
         Returns:
             Standardized measurement name for writers
         """
-        # Import centralized naming system
-        from collector.config.endpoint_categories import get_measurement_name
-
-        # Use centralized endpoint-to-measurement mapping
-        standardized_name = get_measurement_name(endpoint_name)
-
-        # Handle special cases for legacy JSON replay naming
-        if standardized_name == endpoint_name and endpoint_name.startswith('events_'):
-            # For events_ prefixed names that aren't in our mapping, they're already in measurement format
-            return endpoint_name
-
-        return standardized_name
+        # Use centralized endpoint-to-measurement mapping; unmapped names (including legacy
+        # JSON replay events_ names, already in measurement format) are returned unchanged
+        return get_measurement_name(endpoint_name)
 
     def _enrich_environmental_data(self, env_type: str, records: List[Dict[str, Any]], enrichment_processor) -> List[Dict[str, Any]]:
         """
@@ -724,16 +845,21 @@ class MetricsCollector:
             elif env_type == 'env_temperature':
                 return enrichment_processor.environmental_temperature_enricher.enrich(records)
             else:
-                self.logger.warning(f"Unknown environmental data type: {env_type}")
+                self.logger.warning("Unknown environmental data type: %s", env_type)
                 return records
 
         except Exception as e:
-            self.logger.error(f"Environmental enrichment failed for {env_type}: {e}")
+            self.logger.error("Environmental enrichment failed for %s: %s", env_type, e)
             # Return original records on error to avoid data loss
             return records
 
     def cleanup(self) -> None:
         """Clean up collector resources with graceful writer shutdown."""
+        self.stop()
+
+        # Let the background writer finish any queued cycles before the writer is closed
+        self._stop_writer_thread()
+
         # First ensure writer is properly closed and flushed (from app/main.py finally block)
         if self.writer:
             if hasattr(self.writer, 'close') and callable(getattr(self.writer, 'close')):
@@ -742,7 +868,7 @@ class MetricsCollector:
                     self.writer.close(timeout_seconds=90, force_exit_on_timeout=False)
                     self.logger.info("Writer closed successfully")
                 except Exception as e:
-                    self.logger.warning(f"Error closing writer: {e}")
+                    self.logger.warning("Error closing writer: %s", e)
             self.writer = None
 
         # Clean up datasource
@@ -761,5 +887,7 @@ class MetricsCollector:
             'collections_completed': self.collections_completed,
             'last_collection_time': self.last_collection_time,
             'datasource_type': 'json_replay' if self.config.use_json_replay else 'live_api',
+            'write_failures': self.write_failures,
+            'last_write_success': self.last_write_success,
             'system_info': self.datasource.get_system_info() if self.datasource else None
         }
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CollectorConfig:
     """Main configuration for the collector system.
 
@@ -31,6 +31,7 @@ class CollectorConfig:
     interval_time: int = 60  # seconds between collections
     include_events: bool = True
     include_environmental: bool = True
+    strict_config_settle: bool = False  # Keep the legacy 2s minimum between config and other collections
 
     # Debugging
     debug: bool = False
@@ -60,23 +61,25 @@ class CollectorConfig:
 
         Compatible with existing app/main.py argument parsing.
         """
+        d = vars(args)
         return cls(
-            use_json_replay=hasattr(args, 'fromJson') and args.fromJson is not None,
-            from_json=getattr(args, 'fromJson', None),
-            system_id=getattr(args, 'systemId', None),
-            api=getattr(args, 'api', None),
-            username=getattr(args, 'username', None),
-            password=getattr(args, 'password', None),
-            tls_ca=getattr(args, 'tlsCa', None),
-            tls_validation=getattr(args, 'tlsValidation', 'strict'),
-            output=getattr(args, 'output', 'both'),
-            interval_time=getattr(args, 'intervalTime', 60),
-            include_events=getattr(args, 'include_events', True),
-            include_environmental=getattr(args, 'include_environmental', True),
-            debug=getattr(args, 'debug', False),
-            log_level=getattr(args, 'log_level', 'INFO'),
-            logfile=getattr(args, 'logfile', None),
-            max_iterations=getattr(args, 'maxIterations', 0)
+            use_json_replay=d.get('fromJson') is not None,
+            from_json=d.get('fromJson', None),
+            system_id=d.get('systemId', None),
+            api=d.get('api', None),
+            username=d.get('username', None),
+            password=d.get('password', None),
+            tls_ca=d.get('tlsCa', None),
+            tls_validation=d.get('tlsValidation', 'strict'),
+            output=d.get('output', 'both'),
+            interval_time=d.get('intervalTime', 60),
+            include_events=d.get('include_events', True),
+            include_environmental=d.get('include_environmental', True),
+            strict_config_settle=d.get('strict_config_settle', False),
+            debug=d.get('debug', False),
+            log_level=d.get('log_level', 'INFO'),
+            logfile=d.get('logfile', None),
+            max_iterations=d.get('maxIterations', 0)
         )
 
     @staticmethod
@@ -85,12 +88,13 @@ class CollectorConfig:
 
         Returns dictionary that can be used to create WriterConfig.
         """
+        d = vars(args)
         return {
-            'output_format': getattr(args, 'output', 'influxdb'),
-            'influxdb_url': getattr(args, 'influxdbUrl', None),
-            'influxdb_token': getattr(args, 'influxdbToken', None),
-            'influxdb_database': getattr(args, 'influxdbDatabase', None),
-            'prometheus_port': getattr(args, 'prometheus_port', 8000)
+            'output_format': d.get('output', 'influxdb'),
+            'influxdb_url': d.get('influxdbUrl', None),
+            'influxdb_token': d.get('influxdbToken', None),
+            'influxdb_database': d.get('influxdbDatabase', None),
+            'prometheus_port': d.get('prometheus_port', 8000)
         }
 
     def to_dict(self) -> Dict[str, Any]:
@@ -108,6 +112,7 @@ class CollectorConfig:
             'interval_time': self.interval_time,
             'include_events': self.include_events,
             'include_environmental': self.include_environmental,
+            'strict_config_settle': self.strict_config_settle,
             'logfile': self.logfile,
             'max_iterations': self.max_iterations,
         }
@@ -4,9 +4,15 @@ Provides clean separation between configuration parsing and logging setup.
 """
 
 import logging
+import logging.handlers
 import os
 from typing import Optional
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Records buffered before a DEBUG log file is written (ERROR and above flush immediately)
+LOG_FILE_BUFFER_RECORDS = 1024
+
 
 class LoggingConfigurator:
     """Handles all logging setup independently of other configuration."""
@@ -28,12 +34,21 @@ class LoggingConfigurator:
             if log_dir and not os.path.exists(log_dir):
                 os.makedirs(log_dir, exist_ok=True)
 
+            file_handler: logging.Handler = logging.FileHandler(log_file)
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            if level <= logging.DEBUG:
+                # DEBUG emits thousands of records per cycle; write them in batches instead of
+                # one write+flush each. logging.shutdown() flushes the buffer on exit.
+                file_handler = logging.handlers.MemoryHandler(
+                    LOG_FILE_BUFFER_RECORDS, flushLevel=logging.ERROR, target=file_handler
+                )
+
             # Configure file + console logging
             logging.basicConfig(
                 level=level,
-                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                format=LOG_FORMAT,
                 handlers=[
-                    logging.FileHandler(log_file),
+                    file_handler,
                     logging.StreamHandler()  # Also keep console output
                 ]
             )
@@ -41,7 +56,7 @@ class LoggingConfigurator:
             # Console logging only
             logging.basicConfig(
                 level=level,
-                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+                format=LOG_FORMAT
             )
 
     @staticmethod
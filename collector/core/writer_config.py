@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WriterConfig:
     """Configuration specific to output writers.
 
@@ -105,18 +105,17 @@ class WriterConfig:
         """
         # For JSON replay mode, extract system_id from --systemId provided and confirm in extraction
         # But only if system_id wasn't already discovered (backward compatibility)
-        if (hasattr(args, 'fromJson') and args.fromJson and
-            hasattr(args, 'systemId') and args.systemId and
-            system_id == 'unknown'):
-            system_id = args.systemId
+        d = vars(args)
+        if d.get('fromJson') and d.get('systemId') and system_id == 'unknown':
+            system_id = d['systemId']
 
         return cls(
-            output_format=getattr(args, 'output', 'influxdb'),
-            influxdb_url=getattr(args, 'influxdbUrl', None),
-            influxdb_token=getattr(args, 'influxdbToken', None),
-            influxdb_database=getattr(args, 'influxdbDatabase', None),
-            tls_ca=getattr(args, 'tlsCa', None),  # Extract TLS CA for InfluxDB strict validation
-            prometheus_port=getattr(args, 'prometheus_port', 8000),
+            output_format=d.get('output', 'influxdb'),
+            influxdb_url=d.get('influxdbUrl', None),
+            influxdb_token=d.get('influxdbToken', None),
+            influxdb_database=d.get('influxdbDatabase', None),
+            tls_ca=d.get('tlsCa', None),  # Extract TLS CA for InfluxDB strict validation
+            prometheus_port=d.get('prometheus_port', 8000),
             system_id=system_id,
             system_name=system_name
         )
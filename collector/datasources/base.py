@@ -1,5 +1,7 @@
 """Base DataSource interface and shared data structures."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
@@ -14,7 +16,7 @@ class CollectionType(Enum):
     ENVIRONMENTAL = "environmental"
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionResult:
     """Result from a data collection operation."""
     collection_type: CollectionType
@@ -28,7 +30,7 @@ class CollectionResult:
             self.metadata = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemInfo:
     """System identification information."""
     wwn: str
@@ -46,6 +48,10 @@ class DataSource(ABC):
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self._system_info: Optional[SystemInfo] = None
+        self._include_events = config.get('include_events', True)
+        self._include_environmental = config.get('include_environmental', True)
+        # Set once collect_configuration_data() has finished populating config state
+        self._config_ready = threading.Event()
 
     @property
     def system_info(self) -> Optional[SystemInfo]:
@@ -64,9 +70,24 @@ class DataSource(ABC):
 
     @abstractmethod
     def collect_configuration_data(self) -> CollectionResult:
-        """Collect all configuration data types."""
+        """Collect all configuration data types.
+
+        Implementations clear _config_ready on entry and set it once their
+        configuration state is complete (including on failure).
+        """
         pass
 
+    def wait_for_config_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until configuration collection has completed.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if configuration is ready, False on timeout
+        """
+        return self._config_ready.wait(timeout)
+
     @abstractmethod
     def collect_event_data(self) -> CollectionResult:
         """Collect all event/alert data types."""
@@ -115,10 +136,23 @@ class DataSource(ABC):
         return False
 
     def collect_all_data(self) -> Dict[CollectionType, CollectionResult]:
-        """Convenience method to collect all data types."""
-        return {
-            CollectionType.PERFORMANCE: self.collect_performance_data(),
-            CollectionType.CONFIGURATION: self.collect_configuration_data(),
-            CollectionType.EVENTS: self.collect_event_data(),
-            CollectionType.ENVIRONMENTAL: self.collect_environmental_data()
-        }
\ No newline at end of file
+        """Convenience method to collect all data types.
+
+        Configuration is collected first; the remaining types are independent
+        and I/O-bound, so they are collected concurrently. Event and environmental
+        data are omitted from the result when disabled in the configuration.
+        """
+        results = {CollectionType.CONFIGURATION: self.collect_configuration_data()}
+
+        collections = {CollectionType.PERFORMANCE: self.collect_performance_data}
+        if self._include_events:
+            collections[CollectionType.EVENTS] = self.collect_event_data
+        if self._include_environmental:
+            collections[CollectionType.ENVIRONMENTAL] = self.collect_environmental_data
+        with ThreadPoolExecutor(max_workers=len(collections)) as executor:
+            futures = {collection_type: executor.submit(collect)
+                       for collection_type, collect in collections.items()}
+            for collection_type, future in futures.items():
+                results[collection_type] = future.result()
+
+        return results
\ No newline at end of file
@@ -338,6 +338,7 @@ class JSONReplayDataSource(DataSource):
 
     def collect_configuration_data(self) -> CollectionResult:
         """Collect all configuration data types from current JSON batch."""
+        self._config_ready.clear()
         try:
             if not self.config_scheduler:
                 return CollectionResult(
@@ -399,6 +400,8 @@ class JSONReplayDataSource(DataSource):
                 success=False,
                 error_message=str(e)
             )
+        finally:
+            self._config_ready.set()
 
     def _collect_config_type_from_json(self, config_type: str):
         """Collect a specific configuration type from JSON files."""
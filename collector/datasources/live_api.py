@@ -5,11 +5,18 @@ Collects data directly from NetApp E-Series API endpoints.
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
 
 from .base import DataSource, CollectionResult, CollectionType, SystemInfo
 
+# Connections kept alive to the management endpoint, shared by all concurrent collections
+MAX_POOL_CONNECTIONS = 32
+# Parallel endpoint requests per collection type (performance, events and environmental run together)
+MAX_ENDPOINT_WORKERS = 8
+
 
 class LiveAPIDataSource(DataSource):
     """DataSource implementation for live SANtricity API collection.
@@ -98,6 +105,10 @@ class LiveAPIDataSource(DataSource):
 
             # Create session with TLS configuration
             self.session = requests.Session()
+            # Size the pool for concurrent collections so connections (and their TLS state) are reused
+            adapter = HTTPAdapter(pool_connections=len(management_ips), pool_maxsize=MAX_POOL_CONNECTIONS)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
 
             if tls_validation == 'none':
                 # Disable SSL verification and warnings for SANtricity API
@@ -281,9 +292,8 @@ class LiveAPIDataSource(DataSource):
             from ..config.endpoint_categories import get_endpoints_by_category, EndpointCategory
             perf_endpoints = get_endpoints_by_category(EndpointCategory.PERFORMANCE)
 
-            for endpoint_key in perf_endpoints:
+            for endpoint_key, api_response in self._call_api_many(perf_endpoints):
                 try:
-                    api_response = self._call_api(endpoint_key)
                     if api_response:
                         # Use centralized naming for consistency with JSON datasource
                         from ..config.endpoint_categories import get_measurement_name
@@ -324,6 +334,7 @@ class LiveAPIDataSource(DataSource):
 
     def collect_configuration_data(self) -> CollectionResult:
         """Collect all configuration data types from live API."""
+        self._config_ready.clear()
         try:
             if not self.session or not self.active_endpoint or not self.system_id:
                 return CollectionResult(
@@ -348,9 +359,8 @@ class LiveAPIDataSource(DataSource):
             from ..config.endpoint_categories import get_endpoints_by_category, EndpointCategory
             config_endpoints = get_endpoints_by_category(EndpointCategory.CONFIGURATION)
 
-            for endpoint_key in config_endpoints:
+            for endpoint_key, api_response in self._call_api_many(config_endpoints):
                 try:
-                    api_response = self._call_api(endpoint_key)
                     if api_response:
                         # Use centralized naming for consistency with JSON datasource
                         from ..config.endpoint_categories import get_measurement_name
@@ -392,6 +402,8 @@ class LiveAPIDataSource(DataSource):
                 success=False,
                 error_message=str(e)
             )
+        finally:
+            self._config_ready.set()
 
     def collect_event_data(self) -> CollectionResult:
         """Collect all event/alert data types from live API."""
@@ -411,9 +423,8 @@ class LiveAPIDataSource(DataSource):
             from ..config.endpoint_categories import get_endpoints_by_category, EndpointCategory
             event_endpoints = get_endpoints_by_category(EndpointCategory.EVENTS)
 
-            for endpoint_key in event_endpoints:
+            for endpoint_key, api_response in self._call_api_many(event_endpoints):
                 try:
-                    api_response = self._call_api(endpoint_key)
                     if api_response:
                         # Use centralized naming for consistency with JSON datasource
                         from ..config.endpoint_categories import get_measurement_name
@@ -475,9 +486,8 @@ class LiveAPIDataSource(DataSource):
             from ..config.endpoint_categories import get_endpoints_by_category, EndpointCategory
             env_endpoints = get_endpoints_by_category(EndpointCategory.ENVIRONMENTAL)
 
-            for endpoint_key in env_endpoints:
+            for endpoint_key, api_response in self._call_api_many(env_endpoints):
                 try:
-                    api_response = self._call_api(endpoint_key)
                     if api_response and isinstance(api_response, dict):
                         # Use centralized naming for consistency with JSON datasource
                         from ..config.endpoint_categories import get_measurement_name
@@ -525,6 +535,36 @@ class LiveAPIDataSource(DataSource):
                 error_message=str(e)
             )
 
+    def _call_api_many(self, endpoint_keys: Iterable[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Call several endpoints concurrently over the shared session.
+
+        Args:
+            endpoint_keys: Keys from API_ENDPOINTS configuration
+
+        Yields:
+            (endpoint_key, raw JSON response) pairs in the order of endpoint_keys;
+            the response is {} if the call failed
+
+        Note:
+            Endpoints that need a parent object ID ({id} in the template) are
+            skipped, since no parent IDs are collected here.
+        """
+        from ..config.api_endpoints import ID_DEPENDENCIES
+
+        endpoint_keys = [key for key in endpoint_keys if key not in ID_DEPENDENCIES]
+        if not endpoint_keys:
+            return
+        with ThreadPoolExecutor(max_workers=min(len(endpoint_keys), MAX_ENDPOINT_WORKERS)) as executor:
+            yield from zip(endpoint_keys, executor.map(self._call_api_safe, endpoint_keys))
+
+    def _call_api_safe(self, endpoint_key: str) -> Dict[str, Any]:
+        """Call _call_api, turning any exception into an empty response so one endpoint can't fail the rest."""
+        try:
+            return self._call_api(endpoint_key)
+        except Exception as e:
+            self.logger.error(f"API call failed for {endpoint_key}: {e}")
+            return {}
+
     def _call_api(self, endpoint_key: str) -> Dict[str, Any]:
         """Make API call to specified endpoint and return raw JSON response.
 
@@ -534,7 +574,7 @@ class LiveAPIDataSource(DataSource):
         Returns:
             Raw JSON response from API call
         """
-        from ..config.api_endpoints import API_ENDPOINTS
+        from ..config.api_endpoints import API_ENDPOINTS, build_endpoint
 
         if not self.session or not self.active_endpoint:
             self.logger.error("API session not initialized for endpoint call")
@@ -553,11 +593,11 @@ class LiveAPIDataSource(DataSource):
                 self.logger.warning(f"Unknown endpoint key: {endpoint_key}")
             return {}
 
-        # Format endpoint with system_id
-        endpoint_url = endpoint_template.format(system_id=self.system_id)
-        full_url = f"{self.active_endpoint.replace('/devmgr/v2/storage-systems', '')}/{endpoint_url}"
-
         try:
+            # Format endpoint with system_id
+            endpoint_url = build_endpoint(endpoint_key, self.system_id)
+            full_url = f"{self.active_endpoint.replace('/devmgr/v2/storage-systems', '')}/{endpoint_url}"
+
             response = self.session.get(full_url, headers=self.san_headers, timeout=30)
             response.raise_for_status()
             return response.json()
@@ -6,6 +6,7 @@ independence and better architectural separation.
 """
 
 import logging
+import threading
 
 
 class EnrichmentProcessor:
@@ -73,12 +74,20 @@ class EnrichmentProcessor:
 
         # Environmental and event enrichers access system data through the system_enricher
         self.enrichment_data_loaded = False
+        self._load_lock = threading.Lock()
 
     def _load_enrichment_data(self):
         """Load enrichment data from either pre-collected config data or API calls."""
         if self.enrichment_data_loaded:
             return  # Already loaded
 
+        # process() may be called from several threads at once; load only once
+        with self._load_lock:
+            if not self.enrichment_data_loaded:
+                self._load_enrichment_data_locked()
+
+    def _load_enrichment_data_locked(self):
+        """Load enrichment data; the caller holds _load_lock."""
         try:
             # If we have pre-collected config data (JSON mode), use it directly
             if self.config_data:
@@ -35,6 +35,7 @@
 # - FROM_JSON: Directory to replay previously collected JSON metrics
 # - OUTPUT: Output format (influxdb, prometheus, both) - default: influxdb (secure)
 # - PROMETHEUS_PORT: Prometheus metrics port - default: 8000
+# - STRICT_CONFIG_SETTLE: Set to true to wait at least 2s after config collection - default: false
 
 # Check for --config argument and reject it in containerized mode
 for arg in "$@"; do
@@ -135,6 +136,10 @@ if [ -n "$INCLUDE_EVENTS" ] && [ "$INCLUDE_EVENTS" = "false" ]; then
     ARGS="$ARGS --no-events"  
 fi
 
+if [ -n "$STRICT_CONFIG_SETTLE" ] && [ "$STRICT_CONFIG_SETTLE" = "true" ]; then
+    ARGS="$ARGS --strictConfigSettle"
+fi
+
 # Change to the collector directory and run the new collector
 cd /home/collector
 
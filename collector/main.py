@@ -81,6 +81,8 @@ Examples:
                                 help='Disable event data collection')
     behavior_group.add_argument('--no-environmental', dest='include_environmental', action='store_false',
                                 help='Disable environmental monitoring collection')
+    behavior_group.add_argument('--strictConfigSettle', dest='strict_config_settle', action='store_true',
+                                help='Wait at least 2s after configuration collection before collecting other data (legacy behavior)')
 
     # Debugging
     debug_group = parser.add_argument_group('Debugging')
@@ -26,11 +26,11 @@ from typing import Dict, Any, List, Optional
 try:
     # When run as module: python -m collector.raw_collector_cli
     from .config.endpoint_categories import ENDPOINT_CATEGORIES, EndpointCategory, get_measurement_name
-    from .config.api_endpoints import API_ENDPOINTS, ID_DEPENDENCIES
+    from .config.api_endpoints import API_ENDPOINTS, ID_DEPENDENCIES, build_endpoint
 except ImportError:
     # When run standalone from collector directory
     from config.endpoint_categories import ENDPOINT_CATEGORIES, EndpointCategory, get_measurement_name
-    from config.api_endpoints import API_ENDPOINTS, ID_DEPENDENCIES
+    from config.api_endpoints import API_ENDPOINTS, ID_DEPENDENCIES, build_endpoint
 
 # Disable SSL warnings for self-signed certificates
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -188,11 +188,7 @@ class RawApiCollector:
 
         try:
             # Build URL
-            endpoint_path = API_ENDPOINTS[endpoint_key]
-            if object_id:
-                endpoint_path = endpoint_path.format(system_id=self.system_id, id=object_id)
-            else:
-                endpoint_path = endpoint_path.format(system_id=self.system_id)
+            endpoint_path = build_endpoint(endpoint_key, self.system_id, object_id or None)
 
             url = f"{self.base_url}/{endpoint_path}"
 
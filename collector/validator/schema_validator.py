@@ -21,6 +21,15 @@ from ..schema.models import (
 
 LOG = logging.getLogger(__name__)
 
+class ValidatedMeasurements(dict):
+    """
+    Measurements dictionary returned by validate_measurements_for_influxdb.
+
+    Validating it again returns it unchanged, so writers sharing one cycle's
+    data (e.g. MultiWriter with InfluxDB and Prometheus) validate it only once.
+    """
+
+
 class SchemaValidator:
     """
     Validates and converts measurement data using model schemas.
@@ -306,9 +315,13 @@ def validate_measurements_for_influxdb(measurements: Dict[str, Any]) -> Dict[str
     Returns:
         Dictionary with validated measurements
     """
+    if isinstance(measurements, ValidatedMeasurements):
+        LOG.debug("Measurements already validated - skipping schema validation")
+        return measurements
+
     LOG.info("Starting schema-based validation for InfluxDB measurements")
 
-    validated_measurements = {}
+    validated_measurements = ValidatedMeasurements()
 
     for measurement_name, measurement_data in measurements.items():
         try:
@@ -27,6 +27,10 @@ class Writer(ABC):
         'performance_data': 'performance_volume_statistics',  # performance_data wrapper -> volume
     })
 
+    # True if write() converts collector records (dicts, lists, objects) itself,
+    # so the collector can skip its JSON-serialization pass
+    accepts_native = False
+
     @classmethod
     def get_final_measurement_name(cls, internal_name: str) -> str:
         """
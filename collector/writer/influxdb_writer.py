@@ -92,6 +92,8 @@ class InfluxDBWriter(Writer):
     - Enriched tag and field mapping
     """
 
+    accepts_native = True
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize InfluxDB writer with configuration."""
 
@@ -313,15 +315,14 @@ class InfluxDBWriter(Writer):
                         LOG.warning(f"ETHERNET DEBUG: No points created - check conversion process")
 
                 if points:
-                    # Write points using client's automatic batching (following official example)
-                    # The client automatically batches writes based on write_options configuration
-                    for point in points:
-                        try:
-                            self.client.write(record=point)
-                            written_count += 1
-                        except Exception as point_e:
-                            LOG.error(f"Failed to write point: {point_e}")
-                            success = False
+                    # Hand the whole measurement to the client's batching buffer in one call;
+                    # it coalesces points into batch_size/flush_interval bounded requests
+                    try:
+                        self.client.write(record=points)
+                        written_count += len(points)
+                    except Exception as write_e:
+                        LOG.error(f"Failed to write {len(points)} points for {measurement_name}: {write_e}")
+                        success = False
 
                     LOG.info(f"Successfully submitted {len(points)} points for {measurement_name} (automatic batching enabled)")
                 else:
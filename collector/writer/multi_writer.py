@@ -7,6 +7,7 @@ import logging
 from typing import Dict, Any, List
 
 from .base import Writer
+from ..validator.schema_validator import validate_measurements_for_influxdb
 
 # Initialize logger
 LOG = logging.getLogger(__name__)
@@ -27,6 +28,11 @@ class MultiWriter(Writer):
         self.writers = writers
         LOG.info(f"MultiWriter initialized with {len(writers)} writers: {[type(w).__name__ for w in writers]}")
 
+    @property
+    def accepts_native(self) -> bool:
+        """Native data can be passed through only if every wrapped writer accepts it."""
+        return all(writer.accepts_native for writer in self.writers)
+
     def write(self, data: Dict[str, Any], loop_iteration: int = 1) -> bool:
         """
         Write data to all configured writers.
@@ -41,6 +47,13 @@ class MultiWriter(Writer):
         success = True
         results = []
 
+        # Every writer schema-validates its input; do it once here so each of them
+        # receives the same already-validated data instead of converting it again
+        try:
+            data = validate_measurements_for_influxdb(data)
+        except Exception as e:
+            LOG.error(f"Schema validation failed: {e}")
+
         for i, writer in enumerate(self.writers):
             try:
                 writer_name = type(writer).__name__
@@ -23,6 +23,8 @@ class PrometheusWriter(Writer):
     This approach removes the need for manual metric definitions and captures all available fields.
     """
 
+    accepts_native = True
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize Dynamic Prometheus Writer.